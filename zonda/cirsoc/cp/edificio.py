@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from collections import defaultdict
 from functools import cached_property
 from math import log10
@@ -110,6 +111,36 @@ def distancia_a(ancho: float, longitud: float, altura_media: float) -> float:
     return max(valor_propuesto, limite_minimo)
 
 
+_MSG_DOS_AGUAS_GT45 = (
+    "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
+    " Componentes y Revestimientos de cubiertas a dos aguas con ángulo > 45°."
+)
+_MSG_UN_AGUA_ALTURA = (
+    "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
+    " Componentes y Revestimientos de cubiertas a un agua con ángulo > 45° y edificios de gran altura."
+)
+_MSG_UN_AGUA_GT30 = (
+    "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
+    " Componentes y Revestimientos de cubiertas a un agua con ángulo > 30°."
+)
+
+# Referencias para componentes y revestimientos de cubiertas a un agua según si el edificio es de gran altura
+# (altura media > 20 m). Para cada caso: los ángulos límite (inclusive) de cada figura, las figuras y el mensaje de
+# error cuando el ángulo supera el último límite.
+_REFERENCIAS_UN_AGUA = {
+    True: (
+        (10, 30, 45),
+        ("Figura 8", "Figura 5B (cont.) 1", "Figura 5B (cont.) 2"),
+        _MSG_UN_AGUA_ALTURA,
+    ),
+    False: (
+        (3, 10, 30),
+        ("Figura 5B", "Figura 7A", "Figura 7A (cont.)"),
+        _MSG_UN_AGUA_GT30,
+    ),
+}
+
+
 class ParedesSprfvMetodoDireccional:
     """ParedesSprfvMetodoDireccional.
 
@@ -200,6 +231,7 @@ class ParedesComponentes:
         altura_media: float,
         angulo_cubierta: float,
         componentes: Optional[Dict[str, float]] = None,
+        es_gran_altura: Optional[bool] = None,
     ) -> None:
         """
         Args:
@@ -210,16 +242,21 @@ class ParedesComponentes:
             componentes: Los componentes para calcular los valores de cp, donde "key" es el nombre del componente
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
+            es_gran_altura: Indica si el edificio es de gran altura (altura media > 20 m). Si no se especifica, se
+                determina a partir de la altura media.
         """
         self.ancho = ancho
         self.longitud = longitud
         self.altura_media = altura_media
         self.angulo_cubierta = angulo_cubierta
         self.componentes = componentes
-        if self.altura_media <= 20:
-            self.referencia = "Figura 5A"
-        else:
+        if es_gran_altura is None:
+            es_gran_altura = altura_media > 20
+        self.es_gran_altura = es_gran_altura
+        if self.es_gran_altura:
             self.referencia = "Figura 8"
+        else:
+            self.referencia = "Figura 5A"
 
     @cached_property
     def valores(self) -> Union[None, ValoresCpParedesEdificioComponentes]:
@@ -642,6 +679,7 @@ class CubiertaComponentes:
         parapeto: float = 0,
         es_alero: bool = False,
         componentes: Optional[Dict[str, float]] = None,
+        es_gran_altura: Optional[bool] = None,
     ) -> None:
         """
         Args:
@@ -655,6 +693,8 @@ class CubiertaComponentes:
             componentes: Los componentes para calcular los valores de cp, donde "key" es el nombre del componente
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
+            es_gran_altura: Indica si el edificio es de gran altura (altura media > 20 m). Si no se especifica, se
+                determina a partir de la altura media.
         """
         self.ancho = ancho
         self.longitud = longitud
@@ -664,6 +704,9 @@ class CubiertaComponentes:
         self.parapeto = parapeto
         self.es_alero = es_alero
         self.componentes = componentes
+        if es_gran_altura is None:
+            es_gran_altura = altura_media > 20
+        self.es_gran_altura = es_gran_altura
 
     @cached_property
     def distancia_a(self) -> float:
@@ -794,7 +837,7 @@ class CubiertaComponentes:
         Raises:
             ErrorLineamientos cuando la cubierta tiene un angulo > 45°.
         """
-        if self.angulo <= 10 and self.altura_media > 20 and not self.es_alero:
+        if self.angulo <= 10 and self.es_gran_altura and not self.es_alero:
             return "Figura 8"
         elif self.angulo <= 10:
             return "Figura 5B"
@@ -802,10 +845,7 @@ class CubiertaComponentes:
             return "Figura 5B (cont.) 1"
         elif 30 < self.angulo <= 45:
             return "Figura 5B (cont.) 2"
-        raise excepciones.ErrorLineamientos(
-            "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
-            " Componentes y Revestimientos de cubiertas a dos aguas con ángulo > 45°."
-        )
+        raise excepciones.ErrorLineamientos(_MSG_DOS_AGUAS_GT45)
 
     def _referencia_un_agua(self) -> str:
         """
@@ -816,39 +856,58 @@ class CubiertaComponentes:
             ErrorLineamientos cuando la cubierta tiene un ángulo > 30° o cuando el edificio es de gran altura con y el
             ángulo de cubierta es > 10°.
         """
-        if self.altura_media > 20:
-            if self.angulo <= 10:
-                return "Figura 8"
-            elif 10 < self.angulo <= 30:
-                return "Figura 5B (cont.) 1"
-            elif 30 < self.angulo <= 45:
-                return "Figura 5B (cont.) 2"
-            else:
-                raise excepciones.ErrorLineamientos(
-                    "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
-                    " Componentes y Revestimientos de cubiertas a un agua con ángulo > 45° y edificios de gran altura."
-                )
-        if self.angulo <= 3:
-            return "Figura 5B"
-        elif 3 < self.angulo <= 10:
-            return "Figura 7A"
-        elif 10 < self.angulo <= 30:
-            return "Figura 7A (cont.)"
-        raise excepciones.ErrorLineamientos(
-            "El Reglamento CIRSOC 102-2005 no provee lineamientos para calcular los coeficientes de presión para"
-            " Componentes y Revestimientos de cubiertas a un agua con ángulo > 30°."
+        limites_angulo, referencias, mensaje_error = _REFERENCIAS_UN_AGUA[
+            self.es_gran_altura
+        ]
+        indice = bisect_left(limites_angulo, self.angulo)
+        if indice == len(referencias):
+            raise excepciones.ErrorLineamientos(mensaje_error)
+        return referencias[indice]
+
+    @classmethod
+    def alero_desde_cubierta(
+        cls, cubierta: "CubiertaComponentes"
+    ) -> "CubiertaComponentes":
+        """Crea una instancia para el alero a partir de los componentes de la cubierta a la que pertenece.
+
+        La geometría es la misma que la de la cubierta, por lo que se reutiliza la distancia "a" ya calculada y solo se
+        recalculan los coeficientes propios del alero.
+
+        Args:
+            cubierta: Los componentes de la cubierta.
+        """
+        alero = cls(
+            cubierta.ancho,
+            cubierta.longitud,
+            cubierta.altura_media,
+            cubierta.angulo,
+            cubierta.tipo_cubierta,
+            0,
+            True,
+            cubierta.componentes,
+            cubierta.es_gran_altura,
         )
+        alero.distancia_a = cubierta.distancia_a
+        return alero
 
     def __call__(self) -> ValoresCpCubiertaEdificioComponentes:
         return self.valores
 
 
+# Clases que calculan los coeficientes de presión para el SPRFV según el método utilizado.
+_PAREDES_SPRFV = {MetodoSprfv.DIRECCIONAL: ParedesSprfvMetodoDireccional}
+_CUBIERTA_SPRFV = {MetodoSprfv.DIRECCIONAL: CubiertaSprfvMetodoDireccional}
+_ALERO_SPRFV = {MetodoSprfv.DIRECCIONAL: AleroSprfvMetodoDireccional}
+
+
 class Paredes:
     """Paredes.
 
     Determina los coeficientes de presión de paredes de edificio para SPRFV - Componentes y Revestimientos.
     """
 
+    __slots__ = ("sprfv", "componentes")
+
     def __init__(
         self,
         ancho: float,
@@ -857,6 +916,7 @@ class Paredes:
         angulo_cubierta: float,
         componentes: Optional[Dict[str, float]] = None,
         metodo_sprfv: MetodoSprfv = MetodoSprfv.DIRECCIONAL,
+        es_gran_altura: Optional[bool] = None,
     ) -> None:
         """
         Args:
@@ -868,16 +928,21 @@ class Paredes:
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
             metodo_sprfv: El metodo a utilizar para calcular los coeficientes de presión para el SPRFV.
+            es_gran_altura: Indica si el edificio es de gran altura (altura media > 20 m). Si no se especifica, se
+                determina a partir de la altura media.
         """
-        if metodo_sprfv == MetodoSprfv.DIRECCIONAL:
-            self.sprfv = ParedesSprfvMetodoDireccional(ancho, longitud)
-        else:
-            raise NotImplementedError("El método envolvente no esta implementado aún.")
+        try:
+            sprfv = _PAREDES_SPRFV[metodo_sprfv]
+        except KeyError:
+            raise NotImplementedError(
+                "El método envolvente no esta implementado aún."
+            ) from None
+        self.sprfv = sprfv(ancho, longitud)
         self.componentes = ParedesComponentes(
-            ancho, longitud, altura_media, angulo_cubierta, componentes
+            ancho, longitud, altura_media, angulo_cubierta, componentes, es_gran_altura
         )
 
-    @cached_property
+    @property
     def valores(self) -> ValoresCpParedesEdificioMetodoDireccional:
         return {
             SistemaResistente.SPRFV: self.sprfv(),
@@ -894,6 +959,8 @@ class Cubierta:
     Determina los coeficientes de presión de cubierta de edificio para SPRFV - Componentes y Revestimientos.
     """
 
+    __slots__ = ("sprfv", "componentes")
+
     def __init__(
         self,
         ancho: float,
@@ -904,6 +971,7 @@ class Cubierta:
         parapeto: float = 0,
         componentes: Optional[Dict[str, float]] = None,
         metodo_sprfv: MetodoSprfv = MetodoSprfv.DIRECCIONAL,
+        es_gran_altura: Optional[bool] = None,
     ) -> None:
         """
         Args:
@@ -917,13 +985,16 @@ class Cubierta:
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
             metodo_sprfv: El metodo a utilizar para calcular los coeficientes de presión para el SPRFV.
+            es_gran_altura: Indica si el edificio es de gran altura (altura media > 20 m). Si no se especifica, se
+                determina a partir de la altura media.
         """
-        if metodo_sprfv == MetodoSprfv.DIRECCIONAL:
-            self.sprfv = CubiertaSprfvMetodoDireccional(
-                ancho, longitud, altura_media, angulo, tipo_cubierta
-            )
-        else:
-            raise NotImplementedError("El método envolvente no esta implementado aún.")
+        try:
+            sprfv = _CUBIERTA_SPRFV[metodo_sprfv]
+        except KeyError:
+            raise NotImplementedError(
+                "El método envolvente no esta implementado aún."
+            ) from None
+        self.sprfv = sprfv(ancho, longitud, altura_media, angulo, tipo_cubierta)
         self.componentes = CubiertaComponentes(
             ancho,
             longitud,
@@ -933,9 +1004,10 @@ class Cubierta:
             parapeto,
             False,
             componentes,
+            es_gran_altura,
         )
 
-    @cached_property
+    @property
     def valores(self) -> ValoresCpCubiertaEdificioMetodoDireccional:
         return {
             SistemaResistente.SPRFV: self.sprfv(),
@@ -952,6 +1024,8 @@ class Alero:
     Determina los coeficientes de presión de alero de cubierta de edificio para SPRFV - Componentes y Revestimientos.
     """
 
+    __slots__ = ("sprfv", "componentes")
+
     def __init__(
         self,
         ancho: float,
@@ -961,6 +1035,8 @@ class Alero:
         tipo_cubierta: TipoCubierta,
         componentes: Optional[Dict[str, float]] = None,
         metodo_sprfv: MetodoSprfv = MetodoSprfv.DIRECCIONAL,
+        cubierta_componentes: Optional[CubiertaComponentes] = None,
+        es_gran_altura: Optional[bool] = None,
     ) -> None:
         """
         Args:
@@ -973,18 +1049,36 @@ class Alero:
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
             metodo_sprfv: El metodo a utilizar para calcular los coeficientes de presión para el SPRFV.
+            cubierta_componentes: Los componentes de la cubierta a la que pertenece el alero. Si se especifica, se
+                reutiliza su geometría para crear los componentes del alero.
+            es_gran_altura: Indica si el edificio es de gran altura (altura media > 20 m). Si no se especifica, se
+                determina a partir de la altura media.
         """
-        if metodo_sprfv == MetodoSprfv.DIRECCIONAL:
-            self.sprfv = AleroSprfvMetodoDireccional(
-                ancho, longitud, altura_media, angulo, tipo_cubierta
+        try:
+            sprfv = _ALERO_SPRFV[metodo_sprfv]
+        except KeyError:
+            raise NotImplementedError(
+                "El método envolvente no esta implementado aún."
+            ) from None
+        self.sprfv = sprfv(ancho, longitud, altura_media, angulo, tipo_cubierta)
+        if cubierta_componentes is not None:
+            self.componentes = CubiertaComponentes.alero_desde_cubierta(
+                cubierta_componentes
             )
         else:
-            raise NotImplementedError("El método envolvente no esta implementado aún.")
-        self.componentes = CubiertaComponentes(
-            ancho, longitud, altura_media, angulo, tipo_cubierta, 0, True, componentes
-        )
+            self.componentes = CubiertaComponentes(
+                ancho,
+                longitud,
+                altura_media,
+                angulo,
+                tipo_cubierta,
+                0,
+                True,
+                componentes,
+                es_gran_altura,
+            )
 
-    @cached_property
+    @property
     def valores(self) -> ValoresCpAleroEdificioMetodoDireccional:
         return {
             SistemaResistente.SPRFV: self.sprfv(),
@@ -1001,6 +1095,8 @@ class Edificio:
     Determina los coeficientes de presión de edificio para SPRFV - Componentes y Revestimientos.
     """
 
+    __slots__ = ("paredes", "cubierta", "alero")
+
     def __init__(
         self,
         ancho: float,
@@ -1030,6 +1126,9 @@ class Edificio:
                 y "value" es el area del mismo. Requerido para calcular las presiones sobre los componentes y
                 revestimientos.
         """
+        self.alero: Optional[Alero] = None
+        # Se determina una sola vez y se comparte con todas las zonas del edificio.
+        es_gran_altura = altura_media > 20
         self.paredes = Paredes(
             ancho,
             longitud,
@@ -1037,6 +1136,7 @@ class Edificio:
             angulo_cubierta,
             componentes_paredes,
             metodo_sprfv,
+            es_gran_altura,
         )
         self.cubierta = Cubierta(
             ancho,
@@ -1047,6 +1147,7 @@ class Edificio:
             parapeto,
             componentes_cubierta,
             metodo_sprfv,
+            es_gran_altura,
         )
         if alero:
             self.alero = Alero(
@@ -1057,17 +1158,18 @@ class Edificio:
                 tipo_cubierta,
                 componentes_cubierta,
                 metodo_sprfv,
+                self.cubierta.componentes,
+                es_gran_altura,
             )
 
-    @cached_property
+    @property
     def valores(self) -> ValoresCpEdificioMetodoDireccional:
         valores = {
             ZonaEdificio.PAREDES: self.paredes(),
             ZonaEdificio.CUBIERTA: self.cubierta(),
         }
-        alero: Alero = getattr(self, "alero", None)
-        if alero is not None:
-            valores[ZonaEdificio.ALERO] = alero()
+        if self.alero is not None:
+            valores[ZonaEdificio.ALERO] = self.alero()
         return valores
 
     @classmethod
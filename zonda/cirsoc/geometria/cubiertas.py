@@ -8,6 +8,13 @@ class Cubierta:
     """Cubierta.
 
     Genera la geometria de una cubierta.
+
+    Attributes:
+        angulo: El ángulo de la cubierta, en grados. Es 0 para cubiertas planas.
+        area: El área de la cubierta, medida sobre los faldones inclinados, en m².
+        area_mojinete: El área de la zona de mojinete de la pared (el triángulo entre alero y cumbrera), en m².
+        altura_media: La altura media de cubierta, en m. Es la altura de alero si el ángulo es menor o igual a 10° y
+            el promedio entre las alturas de alero y cumbrera en otro caso.
     """
 
     def __init__(
@@ -48,6 +55,29 @@ class Cubierta:
         self.altura_bloqueo = altura_bloqueo
         self.posicion_bloqueo = posicion_bloqueo
 
+        # Las propiedades geométricas (ver Attributes) dependen solo de los argumentos de inicialización, por lo que se
+        # calculan una única vez aquí.
+        delta = self.altura_cumbrera - self.altura_alero
+        if self.tipo_cubierta == TipoCubierta.PLANA:
+            self.angulo: float = 0.0
+            self.area: float = self.ancho * self.longitud
+            self.area_mojinete: float = 0.0
+            self.altura_media: float = self.altura_alero
+        else:
+            if self.tipo_cubierta == TipoCubierta.DOS_AGUAS:
+                pendiente = 2 * delta / self.ancho
+                perimetro_frontal = 2 * math.hypot(delta, self.ancho / 2)
+            else:
+                pendiente = delta / self.ancho
+                perimetro_frontal = math.hypot(delta, self.ancho)
+            self.angulo = math.degrees(math.atan(pendiente))
+            self.area = perimetro_frontal * self.longitud
+            self.area_mojinete = self.ancho * delta / 2
+            if self.angulo <= 10:
+                self.altura_media = self.altura_alero
+            else:
+                self.altura_media = (self.altura_alero + self.altura_cumbrera) / 2
+
     @cached_property
     def relacion_bloqueo(self) -> float:
         """Calcula la relación de bloqueo de la cubierta.
@@ -63,53 +93,3 @@ class Cubierta:
         else:
             altura = self.altura_cumbrera
         return min(self.altura_bloqueo / altura, 1)
-
-    @cached_property
-    def angulo(self) -> float:
-        """Calcula el ángulo de la cubierta.
-
-        Returns:
-            El ángulo de cubierta.
-        """
-        pendiente = (self.altura_cumbrera - self.altura_alero) / self.ancho
-        if self.tipo_cubierta == TipoCubierta.DOS_AGUAS:
-            pendiente *= 2
-        angulo = math.atan(pendiente)
-        return math.degrees(angulo)
-
-    @cached_property
-    def area(self) -> float:
-        """Calcula el área de la cubierta.
-
-        Returns:
-            El area de la cubierta.
-        """
-        if self.tipo_cubierta == TipoCubierta.PLANA:
-            return self.ancho * self.longitud
-
-        altura = self.altura_cumbrera - self.altura_alero
-        if self.tipo_cubierta == TipoCubierta.DOS_AGUAS:
-            perimetro_frontal = 2 * math.hypot(altura, self.ancho / 2)
-        else:
-            perimetro_frontal = math.hypot(altura, self.ancho)
-        return perimetro_frontal * self.longitud
-
-    @cached_property
-    def altura_media(self) -> float:
-        """Calcula la altura media de cubierta.
-
-        Returns:
-            La altura media de cubierta.
-        """
-        if self.angulo <= 10:
-            return self.altura_alero
-        return (self.altura_alero + self.altura_cumbrera) / 2
-
-    @cached_property
-    def area_mojinete(self) -> float:
-        """Calcula el area de la zona de mojinete de la pared.
-
-        Returns:
-            El area de mojinete.
-        """
-        return self.ancho * (self.altura_cumbrera - self.altura_alero) / 2
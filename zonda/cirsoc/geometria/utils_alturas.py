@@ -24,17 +24,16 @@ def array_alturas(
     """
 
     if alturas_personalizadas is not None:
-        alturas = [
-            altura
-            for altura in alturas_personalizadas
-            if altura_inferior <= altura <= altura_superior
-        ]
+        alturas = np.asarray(alturas_personalizadas)
+        alturas = alturas[(alturas >= altura_inferior) & (alturas <= altura_superior)]
     else:
-        alturas = list(range(math.ceil(altura_inferior), math.ceil(altura_superior), 1))
-    # Se añaden valores representativos en el array si no se encuentran.
-    alturas_caracteristicas = (altura_inferior, altura_superior, *otras_alturas)
-    for altura in alturas_caracteristicas:
-        if altura not in alturas:
-            alturas.append(altura)
-    alturas.sort()
-    return np.array(alturas)
+        alturas = np.arange(math.ceil(altura_inferior), math.ceil(altura_superior))
+    # Se añaden valores representativos en el array si no se encuentran. np.unique ordena y elimina los duplicados.
+    alturas_caracteristicas = [
+        altura
+        for altura in (altura_inferior, altura_superior, *otras_alturas)
+        if altura not in alturas
+    ]
+    if alturas_caracteristicas:
+        alturas = np.concatenate((alturas, alturas_caracteristicas))
+    return np.unique(alturas)
@@ -3,10 +3,11 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, Tuple
 
+import numpy as np
+
 from zonda.cirsoc.presiones.base import PresionesBase
 
 if TYPE_CHECKING:
-    import numpy as np
     from zonda.cirsoc.factores import Rafaga
     from zonda.cirsoc import geometria
     from zonda.enums import CategoriaEstructura, CategoriaExposicion
@@ -51,18 +52,15 @@ class Cartel(PresionesBase):
             0.85,
             categoria_exp,
         )
-        self.areas_parciales = areas_parciales
+        self.areas_parciales: np.ndarray = np.asarray(areas_parciales, dtype=float)
         self.cf = cf
         self.factor_rafaga = rafaga.factor
-
-    @cached_property
-    def valores(self) -> np.ndarray:
-        """Calcula los valores de presión para el cartel para cada altura.
-
-        Returns:
-            Los valores de presión.
-        """
-        return self.presiones_velocidad * self.factor_rafaga * self.cf()
+        # Los valores de presión para cada altura se usan en todos los resultados del cartel, por lo que se calculan
+        # al crear la instancia. presiones_velocidad devuelve un array nuevo en cada llamada, por lo que se escala en
+        # el lugar.
+        valores = self.presiones_velocidad
+        valores *= self.factor_rafaga * cf()
+        self.valores: np.ndarray = valores
 
     @cached_property
     def fuerzas_parciales(self) -> np.ndarray:
@@ -80,7 +78,7 @@ class Cartel(PresionesBase):
         Returns:
             La fuerza total.
         """
-        return self.fuerzas_parciales.sum()
+        return float(np.dot(self.valores[1:], self.areas_parciales))
 
     @classmethod
     def desde_cartel(
@@ -3,24 +3,56 @@
 
 from __future__ import annotations
 
-from functools import cached_property, partial, wraps
+import math
+import weakref
+from functools import cached_property, lru_cache, partial, wraps
+from numbers import Real
 from typing import Optional, Union, Tuple, Sequence, TYPE_CHECKING, Callable, Any
 
 import numpy as np
-import vtkmodules.all as vtk
 from vtkmodules.util import numpy_support
+from vtkmodules.vtkCommonColor import vtkNamedColors
+from vtkmodules.vtkCommonCore import VTK_ID_TYPE, vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    VTK_QUAD,
+    VTK_TRIANGLE,
+    vtkCellArray,
+    vtkPlane,
+    vtkPolyData,
+)
+from vtkmodules.vtkCommonExecutionModel import vtkAlgorithm
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersCore import vtkClipPolyData, vtkGlyph3D
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
+from vtkmodules.vtkFiltersSources import vtkArrowSource
+from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkBillboardTextActor3D,
+    vtkPolyDataMapper,
+    vtkProperty,
+    vtkTextActor,
+    vtkTextProperty,
+)
 
 from zonda.enums import Unidad
-from zonda.graficos.directores.utils_iter import aplicar_func_recursivamente
+from zonda.graficos.directores.utils_iter import (
+    indexar_hojas,
+    reconstruir_estructura,
+)
 from zonda.unidades import convertir_unidad
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkCommonCore import vtkLookupTable
+    from vtkmodules.vtkCommonDataModel import vtkCell, vtkColor3d
+    from vtkmodules.vtkCommonExecutionModel import vtkPolyDataAlgorithm
+    from vtkmodules.vtkRenderingCore import vtkRenderer
     from zonda.tipos import Punto
 
-colores = vtk.vtkNamedColors()
+colores = vtkNamedColors()
 
 
-def color_3d(color: Optional[str] = None) -> vtk.vtkColor3d:
+def color_3d(color: Optional[str] = None) -> vtkColor3d:
     """Obtiene un color 3D desde un string.
 
     Args:
@@ -29,31 +61,265 @@ def color_3d(color: Optional[str] = None) -> vtk.vtkColor3d:
     Returns:
         El color 3D.
     """
-    color = color or "Gainsboro"
+    return _color_3d(color or "Gainsboro")
+
+
+@lru_cache(maxsize=128)
+def _color_3d(color: str) -> vtkColor3d:
+    """Obtiene un color 3D desde un string.
+
+    Los colores usados en las escenas son pocos y se piden en la creación de cada actor, por lo que se guardan para no
+    volver a buscarlos en vtkNamedColors. El color devuelto es compartido y no debe ser modificado.
+
+    Args:
+        color: El nombre del color.
+
+    Returns:
+        El color 3D.
+    """
     return colores.GetColor3d(color)
 
 
-def crear_poly_data(puntos: Sequence[Punto]) -> vtk.vtkPolyData:
-    vtk_puntos = vtk.vtkPoints()
-    polygon = vtk.vtkPolygon()
-    polygon.GetPointIds().SetNumberOfIds(len(puntos))
-    for i, p in enumerate(puntos):
-        vtk_puntos.InsertNextPoint(*p)
-        polygon.GetPointIds().SetId(i, i)
-    polygons = vtk.vtkCellArray()
-    polygons.InsertNextCell(polygon)
+# Propiedades de texto base, creadas una sola vez. ActorTexto2D y ActorBarraEscala no modifican su propiedad por lo que
+# la comparten, mientras que ActorLabel trabaja sobre una copia ya que cambia el tamaño de su texto.
+_PROPIEDAD_TEXTO_2D = vtkTextProperty()
+_PROPIEDAD_TEXTO_2D.SetColor(color_3d("Black"))
+_PROPIEDAD_TEXTO_2D.SetFontSize(15)
+_PROPIEDAD_TEXTO_2D.SetVerticalJustificationToTop()
+_PROPIEDAD_TEXTO_2D.SetFontFamilyAsString("Arial")
+
+_PROPIEDAD_TEXTO_BARRA = vtkTextProperty()
+_PROPIEDAD_TEXTO_BARRA.SetColor(color_3d("Black"))
+_PROPIEDAD_TEXTO_BARRA.SetFontSize(12)
+_PROPIEDAD_TEXTO_BARRA.SetVerticalJustificationToCentered()
+
+_PROPIEDAD_TEXTO_LABEL = vtkTextProperty()
+_PROPIEDAD_TEXTO_LABEL.SetColor(color_3d("Black"))
+_PROPIEDAD_TEXTO_LABEL.SetFrameColor(color_3d("Black"))
+_PROPIEDAD_TEXTO_LABEL.SetFontSize(12)
+_PROPIEDAD_TEXTO_LABEL.SetVerticalJustificationToBottom()
+_PROPIEDAD_TEXTO_LABEL.SetFrame(True)
+_PROPIEDAD_TEXTO_LABEL.SetBackgroundColor(237 / 255, 237 / 255, 237 / 255)
+_PROPIEDAD_TEXTO_LABEL.SetBackgroundOpacity(1)
+_PROPIEDAD_TEXTO_LABEL.UseTightBoundingBoxOff()
+
+
+def _configurar_propiedad_poligono(
+    propiedad: vtkProperty, color: Optional[str]
+) -> None:
+    """Configura la propiedad de un actor poligono: bordes visibles y el color ingresado.
+
+    Args:
+        propiedad: La propiedad a configurar.
+        color: El color del poligono.
+    """
+    propiedad.EdgeVisibilityOn()
+    propiedad.SetLineWidth(2)
+    propiedad.SetColor(color_3d(color))
+
+
+@lru_cache(maxsize=None)
+def _propiedad_poligono(color: Optional[str]) -> vtkProperty:
+    """Obtiene la propiedad compartida por los actores poligono de un color que no representan presiones.
+
+    Estos actores no cambian su color, por lo que todos los de un mismo color usan la misma propiedad en lugar de
+    inicializar una por actor. La propiedad devuelta no debe ser modificada.
+
+    Args:
+        color: El color del poligono.
+
+    Returns:
+        La propiedad.
+    """
+    propiedad = vtkProperty()
+    _configurar_propiedad_poligono(propiedad, color)
+    return propiedad
+
+
+def _crear_fuente_flecha(invertir: bool) -> vtkArrowSource:
+    """Crea la fuente de la geometría de las flechas de presión.
+
+    Args:
+        invertir: Indica si la flecha debe apuntar hacia el origen.
+
+    Returns:
+        La fuente de la flecha.
+    """
+    fuente = vtkArrowSource()
+    fuente.SetTipResolution(30)
+    fuente.SetShaftResolution(30)
+    fuente.SetInvert(invertir)
+    fuente.SetShaftRadius(0.03)
+    fuente.SetTipRadius(0.1)
+    fuente.SetTipLength(0.3)
+    return fuente
+
+
+# Todas las flechas de presión tienen la misma geometría y solo difieren en su sentido, por lo que comparten estas dos
+# fuentes en lugar de teselar una flecha por actor.
+_FLECHA = _crear_fuente_flecha(False)
+_FLECHA_INVERTIDA = _crear_fuente_flecha(True)
+
+# Polydatas de los poligonos, indexadas por sus coordenadas. Los poligonos idénticos (por ejemplo los del mismo
+# edificio en las escenas de cada dirección de viento) comparten la polydata, que no se modifica una vez creada. Al
+# usar referencias débiles las polydatas se liberan cuando ningún actor las utiliza.
+_POLY_DATAS = weakref.WeakValueDictionary()
+
+
+def _coords_poligono(puntos: Sequence[Punto]) -> np.ndarray:
+    """Convierte los puntos de un poligono en un array de numpy de forma (N, 3).
+
+    Args:
+        puntos: Los puntos X, Y, Z que forman el poligono.
+
+    Returns:
+        Las coordenadas del poligono.
+
+    Raises:
+        TypeError: Si los puntos no forman una secuencia de puntos X, Y, Z.
+    """
+    coords = np.asarray(puntos, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise TypeError("Los puntos deben ser una secuencia de puntos X, Y, Z.")
+    return coords
+
+
+def _es_poligono(ob: Any) -> bool:
+    """Indica si un objeto es un poligono, es decir una secuencia de puntos X, Y, Z.
+
+    Args:
+        ob: El objeto a evaluar.
+
+    Returns:
+        True si el primer elemento del objeto es un punto.
+    """
+    try:
+        coord = ob[0][0]
+    except (TypeError, IndexError, KeyError):
+        return False
+    return isinstance(coord, Real)
+
+
+def crear_poly_datas(
+    lista_puntos: Sequence[Sequence[Punto]],
+) -> Tuple[vtkPolyData, ...]:
+    """Crea una polydata por cada poligono ingresado.
+
+    Las coordenadas de todos los poligonos se convierten en un único array y la conectividad de las celdas se genera
+    una sola vez para cada cantidad de vértices, en lugar de armarlas poligono por poligono.
+
+    Args:
+        lista_puntos: Los puntos X, Y, Z de cada poligono.
+
+    Returns:
+        Las polydatas de los poligonos, en el mismo orden en que fueron ingresados.
+
+    Raises:
+        TypeError: Si alguno de los poligonos no es una secuencia de puntos X, Y, Z.
+    """
+    lista_coords = [_coords_poligono(puntos) for puntos in lista_puntos]
+    if not lista_coords:
+        return ()
+    coords = np.concatenate(lista_coords)
+    cantidades = [len(c) for c in lista_coords]
+    finales = np.cumsum(cantidades).tolist()
+
+    conectividades = {}
+    poly_datas = []
+    for n_puntos, fin in zip(cantidades, finales):
+        coords_poligono = coords[fin - n_puntos : fin]
+        clave = coords_poligono.tobytes()
+        poly_data = _POLY_DATAS.get(clave)
+        if poly_data is not None:
+            poly_datas.append(poly_data)
+            continue
+
+        # Los puntos de cada polydata referencian su porción del array de coordenadas sin copiarla. numpy_to_vtk
+        # guarda una referencia al array, que es propio de esta función y no se modifica luego.
+        vtk_puntos = vtkPoints()
+        vtk_puntos.SetData(numpy_support.numpy_to_vtk(coords_poligono, deep=False))
+
+        offsets_conectividad = conectividades.get(n_puntos)
+        if offsets_conectividad is None:
+            # Se usa el formato interno de VTK 9 (offsets y conectividad por separado), por lo que VTK no tiene que
+            # convertir las celdas desde el formato [cantidad de puntos, id_0, ..., id_n-1]. Las celdas no se
+            # modifican una vez creadas, así que los arrays se comparten entre las polydatas con igual cantidad de
+            # puntos.
+            tipo_id = numpy_support.get_numpy_array_type(VTK_ID_TYPE)
+            offsets_conectividad = (
+                numpy_support.numpy_to_vtkIdTypeArray(
+                    np.array((0, n_puntos), dtype=tipo_id), deep=True
+                ),
+                numpy_support.numpy_to_vtkIdTypeArray(
+                    np.arange(n_puntos, dtype=tipo_id), deep=True
+                ),
+            )
+            conectividades[n_puntos] = offsets_conectividad
+        polygons = vtkCellArray()
+        polygons.SetData(*offsets_conectividad)
 
-    poly_data = vtk.vtkPolyData()
-    poly_data.SetPoints(vtk_puntos)
-    poly_data.SetPolys(polygons)
+        poly_data = vtkPolyData()
+        poly_data.SetPoints(vtk_puntos)
+        poly_data.SetPolys(polygons)
+        _POLY_DATAS[clave] = poly_data
+        poly_datas.append(poly_data)
 
-    return poly_data
+    return tuple(poly_datas)
+
+
+def crear_poly_data(puntos: Sequence[Punto]) -> vtkPolyData:
+    """Crea una polydata formada por un único poligono.
+
+    Args:
+        puntos: Los puntos X, Y, Z que forman el poligono.
+
+    Returns:
+        La polydata del poligono.
+
+    Raises:
+        TypeError: Si los puntos no forman una secuencia de puntos X, Y, Z.
+    """
+    return crear_poly_datas((puntos,))[0]
+
+
+def _normal_centro_celda(celda: vtkCell) -> Tuple[np.ndarray, np.ndarray]:
+    """Calcula la normal y el centro de una celda poligonal.
+
+    Se obtienen los mismos valores que con vtkPolyDataNormals y vtkCellCenters: la normal por el método de Newell y
+    el centro paramétrico de la celda, que para triángulos y cuadriláteros es el promedio de sus vértices y para el
+    resto de los poligonos es el centro del rectángulo que los contiene en el plano del poligono, orientado según su
+    primer lado.
+
+    Args:
+        celda: La celda poligonal.
+
+    Returns:
+        La normal unitaria y el centro de la celda.
+    """
+    coords = numpy_support.vtk_to_numpy(celda.GetPoints().GetData())
+    relativas = coords - coords[0]
+    normal = np.cross(relativas, np.roll(relativas, -1, axis=0)).sum(axis=0)
+    # Al igual que en VTK, la normal de una celda degenerada (de área nula) se deja como vector nulo.
+    longitud = np.linalg.norm(normal)
+    if longitud:
+        normal /= longitud
+    if celda.GetCellType() in (VTK_TRIANGLE, VTK_QUAD):
+        return normal, coords.mean(axis=0)
+    eje_s = relativas[1]
+    eje_t = np.cross(normal, eje_s)
+    centro = coords[0].copy()
+    for eje in (eje_s, eje_t):
+        longitud = eje @ eje
+        if longitud:
+            proyecciones = relativas @ eje / longitud
+            centro += (proyecciones.min() + proyecciones.max()) / 2 * eje
+    return normal, centro
 
 
 def crear_mapper(
-    data: Union[vtk.vtkPolyData, vtk.vtkPolyDataAlgorithm],
+    data: Union[vtkPolyData, vtkPolyDataAlgorithm],
     scalar_visibility: bool = False,
-) -> vtk.vtkPolyDataMapper:
+) -> vtkPolyDataMapper:
     """
 
     Args:
@@ -63,10 +329,10 @@ def crear_mapper(
     Returns:
         Un mapper.
     """
-    mapper = vtk.vtkPolyDataMapper()
-    try:
+    mapper = vtkPolyDataMapper()
+    if isinstance(data, vtkAlgorithm):
         mapper.SetInputConnection(data.GetOutputPort())
-    except (TypeError, AttributeError):
+    else:
         mapper.SetInputData(data)
     if not scalar_visibility:
         mapper.ScalarVisibilityOff()
@@ -74,13 +340,13 @@ def crear_mapper(
 
 
 def clip_poly_data(
-    poly_data: vtk.vtkPolyData, origen: Punto, normal: Punto
-) -> Union[None, vtk.vtkPolyData]:
-    plano = vtk.vtkPlane()
+    poly_data: vtkPolyData, origen: Punto, normal: Punto
+) -> Union[None, vtkPolyData]:
+    plano = vtkPlane()
     plano.SetOrigin(*origen)
     plano.SetNormal(*normal)
 
-    clip = vtk.vtkClipPolyData()
+    clip = vtkClipPolyData()
     clip.SetClipFunction(plano)
     clip.SetInputData(poly_data)
     clip.Update()
@@ -94,10 +360,10 @@ def clip_poly_data(
 
 
 def crear_actor(
-    data: Union[vtk.vtkPolyData, vtk.vtkPolyDataAlgorithm],
+    data: Union[vtkPolyData, vtkPolyDataAlgorithm],
     color: Optional[str] = None,
     scalar_visibility: bool = False,
-) -> vtk.vtkActor:
+) -> vtkActor:
     """Crea un actor VTK.
 
     Args:
@@ -109,7 +375,7 @@ def crear_actor(
         Un actor.
     """
     mapper = crear_mapper(data, scalar_visibility)
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
 
     if color is not None:
@@ -124,7 +390,7 @@ class ActorMixin:
     Agrega funcionalidad para añadir u ocultar actores en el renderer.
     """
 
-    def __init__(self, renderer: vtk.vtkRenderer) -> None:
+    def __init__(self, renderer: vtkRenderer) -> None:
         self.renderer = renderer
 
     def _añadir(self) -> None:
@@ -140,22 +406,16 @@ class ActorMixin:
         self.VisibilityOff()
 
 
-class ActorTexto2D(vtk.vtkTextActor, ActorMixin):
+class ActorTexto2D(vtkTextActor, ActorMixin):
     """ActorTexto2D.
 
     Genera un texto 2D usado para titulo o anotaciones del grafico en VTK.
     """
 
-    def __init__(self, renderer: vtk.vtkRenderer) -> None:
+    def __init__(self, renderer: vtkRenderer) -> None:
         super().__init__(renderer)
 
-        propiedad_texto = vtk.vtkTextProperty()
-        propiedad_texto.SetColor(color_3d("Black"))
-        propiedad_texto.SetFontSize(15)
-        propiedad_texto.SetVerticalJustificationToTop()
-        propiedad_texto.SetFontFamilyAsString("Arial")
-
-        self.SetTextProperty(propiedad_texto)
+        self.SetTextProperty(_PROPIEDAD_TEXTO_2D)
         self.GetPositionCoordinate().SetCoordinateSystemToNormalizedDisplay()
         self.SetPosition(0.025, 0.975)
 
@@ -171,7 +431,7 @@ class ActorTexto2D(vtk.vtkTextActor, ActorMixin):
         self.SetInput(texto)
 
 
-class ActorBarraEscala(vtk.vtkScalarBarActor, ActorMixin):
+class ActorBarraEscala(vtkScalarBarActor, ActorMixin):
     """ActorBarraEscala.
 
     Genera una barra de escalas de colores.
@@ -179,8 +439,8 @@ class ActorBarraEscala(vtk.vtkScalarBarActor, ActorMixin):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        tabla_colores: vtk.vtkLookupTable,
+        renderer: vtkRenderer,
+        tabla_colores: vtkLookupTable,
         unidad: Unidad,
     ) -> None:
         """
@@ -191,12 +451,7 @@ class ActorBarraEscala(vtk.vtkScalarBarActor, ActorMixin):
         """
         super().__init__(renderer)
 
-        propiedad_texto = vtk.vtkTextProperty()
-        propiedad_texto.SetColor(color_3d("Black"))
-        propiedad_texto.SetFontSize(12)
-        propiedad_texto.SetVerticalJustificationToCentered()
-
-        self.SetLabelTextProperty(propiedad_texto)
+        self.SetLabelTextProperty(_PROPIEDAD_TEXTO_BARRA)
         self.SetLookupTable(tabla_colores)
         self.SetNumberOfLabels(4)
         self.SetMaximumWidthInPixels(75)
@@ -210,7 +465,7 @@ class ActorBarraEscala(vtk.vtkScalarBarActor, ActorMixin):
         self._añadir()
 
 
-class ActorLabel(vtk.vtkBillboardTextActor3D, ActorMixin):
+class ActorLabel(vtkBillboardTextActor3D, ActorMixin):
     """ActorLabel.
 
     Representa un recuadro con texto que siempre mira a la cámara.
@@ -218,7 +473,7 @@ class ActorLabel(vtk.vtkBillboardTextActor3D, ActorMixin):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
+        renderer: vtkRenderer,
         tamaño_texto: int = 12,
         borde: bool = True,
         centrado: bool = False,
@@ -235,17 +490,12 @@ class ActorLabel(vtk.vtkBillboardTextActor3D, ActorMixin):
 
         self.tamaño_texto = tamaño_texto
 
-        rgb = 237 / 255
-
-        self._propiedad_texto = vtk.vtkTextProperty()
-        self._propiedad_texto.SetColor(color_3d("Black"))
-        self._propiedad_texto.SetFrameColor(color_3d("Black"))
-        self._propiedad_texto.SetFontSize(tamaño_texto)
-        self._propiedad_texto.SetVerticalJustificationToBottom()
-        self._propiedad_texto.SetFrame(borde)
-        self._propiedad_texto.SetBackgroundColor(rgb, rgb, rgb)
-        self._propiedad_texto.SetBackgroundOpacity(1)
-        self._propiedad_texto.UseTightBoundingBoxOff()
+        self._propiedad_texto = vtkTextProperty()
+        self._propiedad_texto.ShallowCopy(_PROPIEDAD_TEXTO_LABEL)
+        if tamaño_texto != _PROPIEDAD_TEXTO_LABEL.GetFontSize():
+            self._propiedad_texto.SetFontSize(tamaño_texto)
+        if not borde:
+            self._propiedad_texto.SetFrame(False)
         if centrado:
             self._propiedad_texto.SetJustificationToCentered()
             self._propiedad_texto.SetVerticalJustificationToCentered()
@@ -289,7 +539,7 @@ class ActorLabel(vtk.vtkBillboardTextActor3D, ActorMixin):
         self._propiedad_texto.SetFontSize(int(tamaño))
 
 
-class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
+class ActorFlechaPresion(vtkActor, ActorMixin):
     """ActorFlechaPresion.
 
     Actor representado por una flecha que se usa para indicar las presiones sobre las superficies.
@@ -297,32 +547,35 @@ class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        normal_centro: vtk.vtkCellCenters,
+        renderer: vtkRenderer,
+        normal_centro: vtkPolyData,
         max_valor_presion: float,
     ) -> None:
         """
 
         Args:
             renderer: El renderer utilizado para añadir u ocultar el actor.
-            normal_centro: La norma en el centro de un poligono.
+            normal_centro: Los centros de los poligonos con sus normales.
             max_valor_presion: El mayor valor de presión. Se utiliza para escalar el actor en base a este valor.
         """
         super().__init__(renderer)
         self.normals_centro = normal_centro
         self.max_valor_presion = max_valor_presion
 
-        self._arrow_source = vtk.vtkArrowSource()
-        self._arrow_source.SetTipResolution(30)
-        self._arrow_source.SetShaftResolution(30)
-        self._arrow_source.InvertOn()
-        self._arrow_source.SetShaftRadius(0.03)
-        self._arrow_source.SetTipRadius(0.1)
-        self._arrow_source.SetTipLength(0.3)
+        self._arrow_source = _FLECHA_INVERTIDA
 
         self._escala_base = 7
-
-        self._mapper = crear_mapper(self._glyph3d)
+        self._escala = 1.0
+
+        # Cuando la polydata tiene un solo poligono (el caso habitual) la flecha se orienta con una transformación en
+        # lugar de un glyph. Los poligonos recortados pueden tener varias celdas, y en ese caso se usa un glyph que
+        # ubica una flecha en cada una.
+        self._una_flecha = normal_centro.GetNumberOfPoints() == 1
+        if self._una_flecha:
+            self._actualizar_transformacion()
+            self._mapper = crear_mapper(self._transformacion)
+        else:
+            self._mapper = crear_mapper(self._glyph3d)
         self.SetMapper(self._mapper)
 
         self.label = ActorLabel(renderer)
@@ -346,25 +599,73 @@ class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
             factor: El factor que modifica la escala.
         """
         self._escala_base *= factor
-        escala_actual = self._glyph3d.GetScaleFactor() * factor
+        escala_actual = self._escala * factor
         self._escalar_reubicar_label(escala_actual)
 
     @cached_property
-    def _glyph3d(self) -> vtk.vtkGlyph3D:
+    def _glyph3d(self) -> vtkGlyph3D:
         """Crea un glyph 3D que sirve para orientar el actor (la flecha) según la normal al polígono.
 
         Returns:
             Glyph3d
         """
-        glyph3d = vtk.vtkGlyph3D()
+        glyph3d = vtkGlyph3D()
         glyph3d.SetSourceConnection(self._arrow_source.GetOutputPort())
         glyph3d.SetVectorModeToUseNormal()
-        glyph3d.SetInputConnection(self.normals_centro.GetOutputPort())
+        glyph3d.SetInputData(self.normals_centro)
         glyph3d.OrientOn()
         glyph3d.Update()
 
         return glyph3d
 
+    @cached_property
+    def _transformacion(self) -> vtkTransformPolyDataFilter:
+        """Crea el filtro que ubica y orienta la flecha según el centro y la normal del polígono.
+
+        Returns:
+            El filtro de transformación.
+        """
+        transformacion = vtkTransformPolyDataFilter()
+        transformacion.SetInputConnection(self._arrow_source.GetOutputPort())
+        transformacion.SetTransform(vtkTransform())
+
+        return transformacion
+
+    @cached_property
+    def _rotacion(self) -> Union[None, Tuple[float, float, float, float]]:
+        """Obtiene la rotación (ángulo y eje) que lleva la flecha, orientada según el eje X, a la dirección de la
+        normal. Se sigue el mismo criterio que vtkGlyph3D.
+
+        Returns:
+            El ángulo y las componentes del eje de rotación o None si la flecha no debe rotarse.
+        """
+        x, y, z = self._normal
+        modulo = math.sqrt(x * x + y * y + z * z)
+        if y == 0 and z == 0:
+            return (180.0, 0.0, 1.0, 0.0) if x < 0 else None
+        if modulo == 0:
+            return None
+        return 180.0, (x + modulo) / 2, y / 2, z / 2
+
+    def _actualizar_transformacion(self) -> None:
+        """Rearma la transformación de la flecha con la escala actual."""
+        transformacion = self._transformacion.GetTransform()
+        transformacion.Identity()
+        transformacion.Translate(self.normals_centro.GetPoint(0))
+        if self._rotacion is not None:
+            transformacion.RotateWXYZ(*self._rotacion)
+        transformacion.Scale(self._escala, self._escala, self._escala)
+
+    @cached_property
+    def _normal(self) -> Tuple[float, float, float]:
+        """Obtiene la normal al polígono. Como el polígono no cambia, se obtiene una sola vez. Se guarda como tupla ya
+        que las operaciones con vectores de tres componentes son más rápidas en Python que en numpy.
+
+        Returns:
+            La normal al polígono.
+        """
+        return self.normals_centro.GetCellData().GetNormals().GetTuple3(0)
+
     def asignar_presion(self, valor: float) -> None:
         """Asigna una presión al actor. Con este valor de presión se escala el actor (la flecha) y se orienta la dependiendo
         del signo de la presión (Positivo entra al poligono y negativo sale del poligono)
@@ -375,8 +676,13 @@ class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
         self._escalar_reubicar_label(
             abs(valor) / self.max_valor_presion * self._escala_base
         )
-        bool_invertir_flecha = valor >= 0
-        self._arrow_source.SetInvert(bool_invertir_flecha)
+        arrow_source = _FLECHA_INVERTIDA if valor >= 0 else _FLECHA
+        if arrow_source is not self._arrow_source:
+            self._arrow_source = arrow_source
+            if self._una_flecha:
+                self._transformacion.SetInputConnection(arrow_source.GetOutputPort())
+            else:
+                self._glyph3d.SetSourceConnection(arrow_source.GetOutputPort())
 
     def mostrar(self) -> None:
         """Añade el actor (la flecha) y el label."""
@@ -392,12 +698,10 @@ class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
         """Cambia la posición del label. Se detecta la escala de la flecha y en base a esta y su posición se obtiene
         el punto extremos de la misma que es donde se ubica el label.
         """
-        escala = self._glyph3d.GetScaleFactor()
-        np_normal = numpy_support.vtk_to_numpy(
-            self.normals_centro.GetOutput().GetCellData().GetNormals()
-        )
-        posicion = np.array(self.GetCenter()) + escala / 2 * 1.05 * np_normal
-        self.label.setear_posicion(posicion)
+        cx, cy, cz = self.GetCenter()
+        nx, ny, nz = self._normal
+        k = self._escala / 2 * 1.05
+        self.label.setear_posicion((cx + k * nx, cy + k * ny, cz + k * nz))
 
     def _escalar_reubicar_label(self, escala: float) -> None:
         """Escala el actor (la flecha) en base al valor ingresado y reubica el label.
@@ -405,12 +709,36 @@ class ActorFlechaPresion(vtk.vtkActor, ActorMixin):
         Args:
             escala: El valor de escala.
         """
-        self._glyph3d.SetScaleFactor(escala)
-        self._glyph3d.Update()
+        # La transformación o el glyph quedan marcados como modificados. No se actualizan explícitamente ya que
+        # reubicar_label obtiene el centro del actor, lo que ejecuta el pipeline una sola vez a través del mapper.
+        self._escala = escala
+        if self._una_flecha:
+            self._actualizar_transformacion()
+        else:
+            self._glyph3d.SetScaleFactor(escala)
         self.reubicar_label()
 
 
-class ActorPresion(vtk.vtkActor, ActorMixin):
+class _FlechaNula:
+    """_FlechaNula.
+
+    Ocupa el lugar de la flecha en los actores poligono que no son de presión. Mostrarla u ocultarla no tiene efecto,
+    por lo que el actor no necesita verificar si tiene flecha.
+    """
+
+    __slots__ = ()
+
+    def mostrar(self) -> None:
+        """No hace nada."""
+
+    def ocultar(self) -> None:
+        """No hace nada."""
+
+
+_FLECHA_NULA = _FlechaNula()
+
+
+class ActorPresion(vtkActor, ActorMixin):
     """ActorPresion.
 
     Visualizar las presiones. Se representada por un poligono que representa el area sobre la que actua el viento, por
@@ -419,11 +747,11 @@ class ActorPresion(vtk.vtkActor, ActorMixin):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
+        renderer: vtkRenderer,
         puntos_poligono: Optional[Sequence[Punto]] = None,
-        poly_data: Optional[vtk.vtkPolyData] = None,
+        poly_data: Optional[vtkPolyData] = None,
         color: Optional[str] = None,
-        tabla_colores: Optional[vtk.vtkLookupTable] = None,
+        tabla_colores: Optional[vtkLookupTable] = None,
         presion: bool = False,
         mostrar: bool = True,
     ) -> None:
@@ -451,16 +779,21 @@ class ActorPresion(vtk.vtkActor, ActorMixin):
 
         self._mapper = crear_mapper(self.poly_data)
         self.SetMapper(self._mapper)
-        self.GetProperty().EdgeVisibilityOn()
-        self.GetProperty().SetLineWidth(2)
-        self.GetProperty().SetColor(color_3d(self.color))
 
         if presion and tabla_colores is not None:
+            # El color de los poligonos de presión cambia con la presión asignada, por lo que cada uno tiene su
+            # propia propiedad.
+            self._propiedad = self.GetProperty()
+            _configurar_propiedad_poligono(self._propiedad, self.color)
             self.flecha = ActorFlechaPresion(
                 self.renderer,
                 self._normals_centro,
                 self._max_valor_presion,
             )
+        else:
+            self._propiedad = _propiedad_poligono(self.color)
+            self.SetProperty(self._propiedad)
+            self.flecha = _FLECHA_NULA
 
         self._añadir()
 
@@ -484,29 +817,32 @@ class ActorPresion(vtk.vtkActor, ActorMixin):
         """
         presion = convertir_unidad(presion, unidad)
         color_poligono = self._obtener_color(presion)
-        self.GetProperty().SetColor(color_poligono)
+        self._propiedad.SetColor(color_poligono)
         self.flecha.asignar_presion(presion)
         self.flecha.label.setear_texto(
             f"{presion:.2f} {unidad.value}/m\u00B2 {str_extra}"
         )
         self.mostrar()
 
+    @property
+    def tiene_flecha(self) -> bool:
+        """Indica si el actor es de presión, es decir si tiene flecha y label."""
+        return self.flecha is not _FLECHA_NULA
+
     def mostrar(self) -> None:
         """Añade el actor y la flecha (si existe)."""
         if not self.GetVisibility():
             self.VisibilityOn()
-            if hasattr(self, "flecha"):
-                self.flecha.mostrar()
+            self.flecha.mostrar()
 
     def ocultar(self) -> None:
         """Oculta el actor y la flecha (si existe)."""
         if self.GetVisibility():
             self.VisibilityOff()
-            if hasattr(self, "flecha"):
-                self.flecha.ocultar()
+            self.flecha.ocultar()
 
     @cached_property
-    def poly_data(self) -> vtk.vtkPolyData:
+    def poly_data(self) -> vtkPolyData:
         """Crea la polydata del poligono.
 
         Returns:
@@ -517,35 +853,37 @@ class ActorPresion(vtk.vtkActor, ActorMixin):
         return crear_poly_data(self.puntos_poligono)
 
     @cached_property
-    def _normals(self) -> vtk.vtkPolyDataNormals:
-        """Obtiene las normales de la polydata.
+    def _normals_centro(self) -> vtkPolyData:
+        """Obtiene los centros de los poligonos de la polydata junto con sus normales.
 
-        Returns:
-            Normales de la polydata.
-        """
-        normals = vtk.vtkPolyDataNormals()
-
-        normals.SetInputData(self._mapper.GetInput())
-        normals.ComputePointNormalsOn()
-        normals.ComputeCellNormalsOn()
-        normals.SplittingOff()
-        normals.ConsistencyOn()
-        normals.AutoOrientNormalsOff()
-        normals.Update()
-
-        return normals
-
-    @cached_property
-    def _normals_centro(self) -> vtk.vtkCellCenters:
-        """Obtiene el centro de las normales.
+        Las normales y los centros se calculan directamente en lugar de usar los filtros vtkPolyDataNormals y
+        vtkCellCenters. Los centros son los puntos del resultado y las normales se asignan tanto a los puntos como a
+        las celdas.
 
         Returns:
-            Centro de las normales.
+            Los centros de los poligonos con sus normales.
         """
-        centro = vtk.vtkCellCenters()
-        centro.SetInputConnection(self._normals.GetOutputPort())
-        centro.VertexCellsOn()
-        centro.Update()
+        normales_centros = [
+            _normal_centro_celda(self.poly_data.GetCell(i))
+            for i in range(self.poly_data.GetNumberOfCells())
+        ]
+        normales = np.array([normal for normal, _ in normales_centros])
+        centros = np.array([centro for _, centro in normales_centros])
+
+        puntos = vtkPoints()
+        puntos.SetData(numpy_support.numpy_to_vtk(centros, deep=True))
+        vertices = vtkCellArray()
+        for i in range(len(centros)):
+            vertices.InsertNextCell(1)
+            vertices.InsertCellPoint(i)
+        vtk_normales = numpy_support.numpy_to_vtk(normales, deep=True)
+        vtk_normales.SetName("Normals")
+
+        centro = vtkPolyData()
+        centro.SetPoints(puntos)
+        centro.SetVerts(vertices)
+        centro.GetPointData().SetNormals(vtk_normales)
+        centro.GetCellData().SetNormals(vtk_normales)
         return centro
 
     def _obtener_color(self, presion: float) -> list:
@@ -602,17 +940,23 @@ def actores_poligonos(
     def wrapped(self, *args, **kwargs):
         puntos = func(self, *args, **kwargs)
         tabla_colores = getattr(self, "tabla_colores", None)
-        actores = aplicar_func_recursivamente(
-            puntos,
-            lambda x: ActorPresion(
+        # Se reunen todos los poligonos para crear sus polydatas y actores en conjunto, manteniendo la estructura
+        # original para el resultado.
+        lista_puntos, estructura = indexar_hojas(puntos, _es_poligono)
+        poly_datas = crear_poly_datas(lista_puntos)
+        actores = [
+            ActorPresion(
                 self.renderer,
-                x,
+                puntos_poligono,
+                poly_data=poly_data,
                 color=color,
                 tabla_colores=tabla_colores,
                 presion=presion,
                 mostrar=mostrar,
-            ),
-        )
+            )
+            for puntos_poligono, poly_data in zip(lista_puntos, poly_datas)
+        ]
+        actores = reconstruir_estructura(estructura, actores)
         if crear_atributo:
             setattr(self, f"actores_{func.__name__}", actores)
 
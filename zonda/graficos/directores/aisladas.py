@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from vtkmodules import all as vtk
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
 
 from zonda.enums import (
     TipoCubierta,
@@ -11,16 +14,45 @@ from zonda.enums import (
     ZonaPresionCubiertaAislada,
     TipoPresionCubiertaAislada,
 )
-from zonda.graficos.actores import actores_poligonos, color_3d
+from zonda.graficos.actores import actores_poligonos, crear_actor
 from zonda.graficos.directores.utils_geometria import (
     coords_zona_cubierta,
-    coords_zona_cubierta_desde_proyeccion,
+    coords_zonas_cubierta_desde_proyeccion,
+    posiciones_camara,
+    zonas_desde_limites,
 )
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkCommonCore import vtkLookupTable
+    from vtkmodules.vtkRenderingCore import vtkCamera, vtkRenderer
+    from zonda.tipos import Punto
     from zonda.cirsoc import CubiertaAislada
 
 
+def _coords_union_zonas(
+    coords: np.ndarray, primera_zona_x: int, ultima_zona_x: int
+) -> np.ndarray:
+    """Obtiene las coordenadas del poligono que cubre todas las zonas entre dos zonas X dadas, a lo largo de todas las
+    zonas Z.
+
+    Args:
+        coords: Las coordenadas de las zonas, de forma (zonas Z, zonas X, 4, 3).
+        primera_zona_x: El indice de la primera zona X.
+        ultima_zona_x: El indice de la ultima zona X.
+
+    Returns:
+        Las coordenadas del poligono, ordenadas igual que las de cada zona.
+    """
+    return np.array(
+        (
+            coords[0, primera_zona_x, 0],
+            coords[0, ultima_zona_x, 1],
+            coords[-1, ultima_zona_x, 2],
+            coords[-1, primera_zona_x, 3],
+        )
+    )
+
+
 class Geometria:
     """Geometria.
     Representa la geometria de una cubierta aislada. Inicializa los actores y setea las diferentes posiciones de la camara.
@@ -28,7 +60,7 @@ class Geometria:
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
+        renderer: vtkRenderer,
         ancho: float,
         longitud: float,
         altura_alero: float,
@@ -76,27 +108,26 @@ class Geometria:
         self.cubierta()
         self._crear_soportes()
 
+    @cached_property
+    def _posiciones_camara(self) -> Tuple[Punto, Dict[PosicionCamara, Punto]]:
+        """Obtiene el punto focal y las posiciones de la cámara. Solo dependen de la geometría, por lo que se calculan
+        una sola vez.
+
+        Returns:
+            El punto focal y las posiciones de la cámara para cada vista.
+        """
+        return posiciones_camara(self.ancho, self.altura_alero, self.longitud)
+
     def setear_posicion_camara(
-        self, camara: vtk.vtkCamera, posicion: PosicionCamara
+        self, camara: vtkCamera, posicion: PosicionCamara
     ) -> None:
         """Setea la posición de la camara.
         Args:
             camara: La camara a la que se le setea la vista.
             posicion: La posición a setear.
         """
-        camara.SetFocalPoint(self.ancho / 2, 0, self.longitud / 2)
-        posiciones = {
-            PosicionCamara.SUPERIOR: (
-                self.ancho / 2,
-                self.altura_alero,
-                self.longitud / 2,
-            ),
-            PosicionCamara.PERSPECTIVA: (self.ancho, self.altura_alero, 0),
-            PosicionCamara.IZQUIERDA: (0, 0, self.longitud / 2),
-            PosicionCamara.DERECHA: (self.ancho, 0, self.longitud / 2),
-            PosicionCamara.FRENTE: (self.ancho / 2, 0, 0),
-            PosicionCamara.CONTRAFRENTE: (self.ancho / 2, 0, self.longitud),
-        }
+        punto_focal, posiciones = self._posiciones_camara
+        camara.SetFocalPoint(*punto_focal)
         camara.SetPosition(*posiciones[posicion])
 
         if posicion == PosicionCamara.SUPERIOR:
@@ -144,27 +175,32 @@ class Geometria:
         )
 
     def _crear_soportes(self):
+        """Crea los soportes de la cubierta. Cada soporte es una línea de una misma polydata, por lo que todos se
+        representan con un único actor.
+        """
+        puntos = vtkPoints()
+        lineas = vtkCellArray()
         for x, y, z in (
             (0, 0, 0),
             (self.ancho, 0, 0),
             (0, 0, self.longitud),
             (self.ancho, 0, self.longitud),
         ):
-            line_source = vtk.vtkLineSource()
-            line_source.SetPoint1(x, y, z)
             if x == self.ancho and self.tipo_cubierta == TipoCubierta.UN_AGUA:
                 altura = self.altura_cumbrera
             else:
                 altura = self.altura_alero
-            line_source.SetPoint2(x, altura, z)
+            lineas.InsertNextCell(2)
+            lineas.InsertCellPoint(puntos.InsertNextPoint(x, y, z))
+            lineas.InsertCellPoint(puntos.InsertNextPoint(x, altura, z))
 
-            mapper = vtk.vtkPolyDataMapper()
-            mapper.SetInputConnection(line_source.GetOutputPort())
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            actor.GetProperty().SetLineWidth(2)
-            actor.GetProperty().SetColor(color_3d("black"))
-            self.renderer.AddActor(actor)
+        poly_data = vtkPolyData()
+        poly_data.SetPoints(puntos)
+        poly_data.SetLines(lineas)
+
+        actor = crear_actor(poly_data, color="black")
+        actor.GetProperty().SetLineWidth(2)
+        self.renderer.AddActor(actor)
 
 
 class Presiones(Geometria):
@@ -176,8 +212,8 @@ class Presiones(Geometria):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        tabla_colores: vtk.vtkLookupTable,
+        renderer: vtkRenderer,
+        tabla_colores: vtkLookupTable,
         cubierta_aislada: CubiertaAislada,
     ) -> None:
         """
@@ -206,12 +242,19 @@ class Presiones(Geometria):
 
     @actores_poligonos(crear_atributo=True, presion=True, mostrar=False)
     def cubierta(self):
+        # Las coordenadas de las zonas se calculan una sola vez. Los faldones de la presión global se obtienen de las
+        # esquinas de las zonas de presión local que los cubren.
         if self.tipo_cubierta == TipoCubierta.DOS_AGUAS:
-            actores_presion_local = self._cubierta_dos_aguas()
-            actores_presion_global = super()._cubierta_dos_aguas()
+            coords = self._coords_zonas_dos_aguas()
+            actores_presion_local = self._zonas_dos_aguas(coords)
+            actores_presion_global = (
+                _coords_union_zonas(coords, 0, 2),
+                _coords_union_zonas(coords, 3, 5),
+            )
         else:
-            actores_presion_local = self._cubierta_un_agua()
-            actores_presion_global = super()._cubierta_un_agua()
+            coords = self._coords_zonas_un_agua()
+            actores_presion_local = self._zonas_un_agua(coords)
+            actores_presion_global = _coords_union_zonas(coords, 0, 2)
         return {
             TipoPresionCubiertaAislada.GLOBAL: actores_presion_global,
             TipoPresionCubiertaAislada.LOCAL: actores_presion_local,
@@ -222,190 +265,102 @@ class Presiones(Geometria):
         self.cubierta()
         self._crear_soportes()
 
-    def _cubierta_un_agua(self):
-        punto_inicio = (0, self.altura_alero)
-        punto_fin = (self.ancho, self.altura_cumbrera)
+    @property
+    def _zonas_z(self) -> np.ndarray:
+        """Obtiene las zonas de presión local sobre el eje Z, que son las mismas para ambos tipos de cubierta.
 
+        Returns:
+            Un array de forma (3, 2) con los valores de inicio y fin de cada zona.
+        """
         long_dividida = self.longitud / 10
-        ancho_dividido = self.ancho / 10
-
-        zonas_z = (
-            (0, long_dividida),
-            (long_dividida, self.longitud - long_dividida),
-            (self.longitud - long_dividida, self.longitud),
+        return zonas_desde_limites(
+            (0, long_dividida, self.longitud - long_dividida, self.longitud)
         )
 
-        fin_ancho_div_resta = self.ancho - ancho_dividido
+    def _coords_zonas_un_agua(self) -> np.ndarray:
+        """Calcula las coordenadas de las zonas de presión local para una cubierta a un agua.
 
-        zonas_x = (
-            (0, ancho_dividido),
-            (ancho_dividido, fin_ancho_div_resta),
-            (fin_ancho_div_resta, self.ancho),
+        Returns:
+            Un array de forma (zonas Z, zonas X, 4, 3) con las coordenadas de cada zona.
+        """
+        ancho_dividido = self.ancho / 10
+        zonas_x = zonas_desde_limites(
+            (0, ancho_dividido, self.ancho - ancho_dividido, self.ancho)
         )
 
-        zonas_c = zonas_x[:1] + zonas_x[-1:]
-
-        coords_zonas_b = []
-        coords_zonas_bc = []
-        for z_inicio, z_fin in zonas_z[:1] + zonas_z[-1:]:
-            coords_zonas_b.append(
-                coords_zona_cubierta_desde_proyeccion(
-                    zonas_x[1], punto_inicio, punto_fin, z_inicio, z_fin
-                )
-            )
-            for zona_x in zonas_c:
-                coords_zonas_bc.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_fin, z_inicio, z_fin
-                    )
-                )
-
-        coords_zonas_a = coords_zona_cubierta_desde_proyeccion(
-            zonas_x[1], punto_inicio, punto_fin, *zonas_z[1]
+        return coords_zonas_cubierta_desde_proyeccion(
+            zonas_x,
+            self._zonas_z,
+            (0, self.ancho),
+            (self.altura_alero, self.altura_cumbrera),
         )
 
-        coords_zonas_c = []
-        for zona_x in zonas_c:
-            coords_zonas_c.append(
-                coords_zona_cubierta_desde_proyeccion(
-                    zona_x, punto_inicio, punto_fin, *zonas_z[1]
-                )
-            )
+    @staticmethod
+    def _zonas_un_agua(coords: np.ndarray):
+        """Agrupa las coordenadas de las zonas de una cubierta a un agua según su zona de presión.
+
+        Args:
+            coords: Las coordenadas obtenidas con `_coords_zonas_un_agua`.
+
+        Returns:
+            Las coordenadas para cada zona de la cubierta.
+        """
+        coords_extremos = coords[[0, 2]]
+        coords_centro = coords[1]
 
         return {
-            ZonaPresionCubiertaAislada.A: coords_zonas_a,
-            ZonaPresionCubiertaAislada.B: coords_zonas_b,
-            ZonaPresionCubiertaAislada.C: coords_zonas_c,
-            ZonaPresionCubiertaAislada.BC: coords_zonas_bc,
+            ZonaPresionCubiertaAislada.A: coords_centro[1],
+            ZonaPresionCubiertaAislada.B: coords_extremos[:, 1],
+            ZonaPresionCubiertaAislada.C: coords_centro[[0, 2]],
+            ZonaPresionCubiertaAislada.BC: coords_extremos[:, [0, 2]].reshape(-1, 4, 3),
         }
 
-    def _cubierta_dos_aguas(self):
-        punto_inicio = (0, self.altura_alero)
-        punto_fin = (self.ancho, self.altura_alero)
-        mitad_ancho = self.ancho / 2
-        punto_mitad = (mitad_ancho, self.altura_cumbrera)
+    def _coords_zonas_dos_aguas(self) -> np.ndarray:
+        """Calcula las coordenadas de las zonas de presión local para una cubierta a dos aguas.
 
-        long_dividida = self.longitud / 10
+        Returns:
+            Un array de forma (zonas Z, zonas X, 4, 3) con las coordenadas de cada zona. Las tres primeras zonas X se
+            encuentran sobre el faldón izquierdo y las tres últimas sobre el derecho.
+        """
+        mitad_ancho = self.ancho / 2
         ancho_dividido = self.ancho / 10
-
-        zonas_z = (
-            (0, long_dividida),
-            (long_dividida, self.longitud - long_dividida),
-            (self.longitud - long_dividida, self.longitud),
+        zonas_x = zonas_desde_limites(
+            (
+                0,
+                ancho_dividido,
+                mitad_ancho - ancho_dividido,
+                mitad_ancho,
+                mitad_ancho + ancho_dividido,
+                self.ancho - ancho_dividido,
+                self.ancho,
+            )
         )
 
-        mitad_ancho_div_resta = mitad_ancho - ancho_dividido
-        mitad_ancho_div_suma = mitad_ancho + ancho_dividido
-        fin_ancho_div_resta = self.ancho - ancho_dividido
-
-        zonas_x = (
-            (0, ancho_dividido),
-            (ancho_dividido, mitad_ancho_div_resta),
-            (mitad_ancho_div_resta, mitad_ancho),
-            (mitad_ancho, mitad_ancho_div_suma),
-            (mitad_ancho_div_suma, fin_ancho_div_resta),
-            (fin_ancho_div_resta, self.ancho),
+        return coords_zonas_cubierta_desde_proyeccion(
+            zonas_x,
+            self._zonas_z,
+            (0, mitad_ancho, self.ancho),
+            (self.altura_alero, self.altura_cumbrera, self.altura_alero),
         )
-        zonas_b_izq = zonas_x[1:2]
-        zonas_b_der = zonas_x[4:5]
-        zonas_a_izq = zonas_b_izq
-        zonas_a_der = zonas_b_der
-        zonas_c_izq = zonas_x[:1]
-        zonas_c_der = zonas_x[-1:]
-        zonas_d_izq = zonas_x[2:3]
-        zonas_d_der = zonas_x[3:4]
-        zonas_esq_bc_izq = zonas_c_izq
-        zonas_esq_bc_der = zonas_c_der
-        zonas_esq_bd_izq = zonas_d_izq
-        zonas_esq_bd_der = zonas_d_der
-
-        coords_zonas_b = []
-        coords_zonas_bc = []
-        coords_zonas_bd = []
-        for z_inicio, z_fin in zonas_z[:1] + zonas_z[-1:]:
-            for zona_x in zonas_b_izq:
-                coords_zonas_b.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_b_der:
-                coords_zonas_b.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_esq_bc_izq:
-                coords_zonas_bc.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_esq_bc_der:
-                coords_zonas_bc.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_esq_bd_izq:
-                coords_zonas_bd.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_esq_bd_der:
-                coords_zonas_bd.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
-
-        coords_zonas_a = []
-        coords_zonas_c = []
-        coords_zonas_d = []
-        for z_inicio, z_fin in zonas_z[1:2]:
-            for zona_x in zonas_a_izq:
-                coords_zonas_a.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_a_der:
-                coords_zonas_a.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_c_izq:
-                coords_zonas_c.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_c_der:
-                coords_zonas_c.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_d_izq:
-                coords_zonas_d.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_inicio, punto_mitad, z_inicio, z_fin
-                    )
-                )
-            for zona_x in zonas_d_der:
-                coords_zonas_d.append(
-                    coords_zona_cubierta_desde_proyeccion(
-                        zona_x, punto_mitad, punto_fin, z_inicio, z_fin
-                    )
-                )
+
+    @staticmethod
+    def _zonas_dos_aguas(coords: np.ndarray):
+        """Agrupa las coordenadas de las zonas de una cubierta a dos aguas según su zona de presión.
+
+        Args:
+            coords: Las coordenadas obtenidas con `_coords_zonas_dos_aguas`.
+
+        Returns:
+            Las coordenadas para cada zona de la cubierta.
+        """
+        coords_extremos = coords[[0, 2]]
+        coords_centro = coords[1]
 
         return {
-            ZonaPresionCubiertaAislada.A: coords_zonas_a,
-            ZonaPresionCubiertaAislada.B: coords_zonas_b,
-            ZonaPresionCubiertaAislada.C: coords_zonas_c,
-            ZonaPresionCubiertaAislada.D: coords_zonas_d,
-            ZonaPresionCubiertaAislada.BC: coords_zonas_bc,
-            ZonaPresionCubiertaAislada.BD: coords_zonas_bd,
+            ZonaPresionCubiertaAislada.A: coords_centro[[1, 4]],
+            ZonaPresionCubiertaAislada.B: coords_extremos[:, [1, 4]].reshape(-1, 4, 3),
+            ZonaPresionCubiertaAislada.C: coords_centro[[0, 5]],
+            ZonaPresionCubiertaAislada.D: coords_centro[[2, 3]],
+            ZonaPresionCubiertaAislada.BC: coords_extremos[:, [0, 5]].reshape(-1, 4, 3),
+            ZonaPresionCubiertaAislada.BD: coords_extremos[:, [2, 3]].reshape(-1, 4, 3),
         }
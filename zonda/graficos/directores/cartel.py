@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from vtkmodules import all as vtk
+from vtkmodules.vtkFiltersSources import vtkCylinderSource
+from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper
 
 from zonda.enums import PosicionCamara
 from zonda.graficos.actores import actores_poligonos, color_3d
 from zonda.graficos.directores.utils_geometria import (
     coords_zona_cubierta,
     coords_pared_rectangular,
+    posiciones_camara,
 )
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkCommonCore import vtkLookupTable
+    from vtkmodules.vtkRenderingCore import vtkCamera, vtkRenderer
+    from zonda.tipos import Punto
     from zonda.cirsoc import Cartel
 
 
@@ -22,7 +28,7 @@ class Geometria:
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
+        renderer: vtkRenderer,
         ancho: float,
         profundidad: float,
         altura_inferior: float,
@@ -120,27 +126,26 @@ class Geometria:
         self.cara_barlovento()
         self._crear_soportes()
 
+    @cached_property
+    def _posiciones_camara(self) -> Tuple[Punto, Dict[PosicionCamara, Punto]]:
+        """Obtiene el punto focal y las posiciones de la cámara. Solo dependen de la geometría, por lo que se calculan
+        una sola vez.
+
+        Returns:
+            El punto focal y las posiciones de la cámara para cada vista.
+        """
+        return posiciones_camara(self.ancho, self.altura_superior, self.profundidad)
+
     def setear_posicion_camara(
-        self, camara: vtk.vtkCamera, posicion: PosicionCamara
+        self, camara: vtkCamera, posicion: PosicionCamara
     ) -> None:
         """Setea la posición de la camara.
         Args:
             camara: La camara a la que se le setea la vista.
             posicion: La posición a setear.
         """
-        camara.SetFocalPoint(self.ancho / 2, 0, self.profundidad / 2)
-        posiciones = {
-            PosicionCamara.SUPERIOR: (
-                self.ancho / 2,
-                self.altura_superior,
-                self.profundidad / 2,
-            ),
-            PosicionCamara.PERSPECTIVA: (self.ancho, self.altura_superior, 0),
-            PosicionCamara.IZQUIERDA: (0, 0, self.profundidad / 2),
-            PosicionCamara.DERECHA: (self.ancho, 0, self.profundidad / 2),
-            PosicionCamara.FRENTE: (self.ancho / 2, 0, 0),
-            PosicionCamara.CONTRAFRENTE: (self.ancho / 2, 0, self.profundidad),
-        }
+        punto_focal, posiciones = self._posiciones_camara
+        camara.SetFocalPoint(*punto_focal)
         camara.SetPosition(*posiciones[posicion])
 
         if posicion == PosicionCamara.SUPERIOR:
@@ -154,7 +159,7 @@ class Geometria:
         if self.altura_inferior > 0:
             radio = min(self.ancho, abs(self.profundidad)) / 4
 
-            cylinder_source = vtk.vtkCylinderSource()
+            cylinder_source = vtkCylinderSource()
             cylinder_source.SetCenter(
                 self.ancho / 2, self.altura_inferior / 2, self.profundidad / 2
             )
@@ -162,9 +167,9 @@ class Geometria:
             cylinder_source.SetHeight(self.altura_inferior)
             cylinder_source.SetResolution(50)
 
-            mapper = vtk.vtkPolyDataMapper()
+            mapper = vtkPolyDataMapper()
             mapper.SetInputConnection(cylinder_source.GetOutputPort())
-            actor = vtk.vtkActor()
+            actor = vtkActor()
             actor.SetMapper(mapper)
             self.renderer.AddActor(actor)
 
@@ -177,8 +182,8 @@ class Presiones(Geometria):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        tabla_colores: vtk.vtkLookupTable,
+        renderer: vtkRenderer,
+        tabla_colores: vtkLookupTable,
         cartel: Cartel,
     ) -> None:
         """
@@ -5,9 +5,11 @@ Además proveé métodos para la configuración de la cámara en diferentes posi
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import cached_property
 from typing import Dict, Tuple, TYPE_CHECKING, Union
 
-from vtkmodules import all as vtk
+from vtkmodules.vtkFiltersCore import vtkMassProperties, vtkTriangleFilter
+from vtkmodules.vtkRenderingCore import vtkPolyDataMapper
 
 from zonda.enums import (
     ParedEdificioSprfv,
@@ -31,12 +33,15 @@ from zonda.graficos.directores.utils_geometria import (
     coords_zona_cubierta_desde_proyeccion,
     proyeccion_punto_horizontal_sobre_cubierta,
     punto_sobre_vector,
+    posiciones_camara,
 )
 from zonda.graficos.directores.utils_iter import aplicar_func_recursivamente
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkCommonCore import vtkLookupTable
+    from vtkmodules.vtkRenderingCore import vtkCamera, vtkRenderer
     from zonda.cirsoc import Edificio
-    from zonda.tipos import Punto2D
+    from zonda.tipos import Punto, Punto2D
 
 
 class Geometria:
@@ -47,7 +52,7 @@ class Geometria:
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
+        renderer: vtkRenderer,
         ancho: float,
         longitud: float,
         altura_alero: float,
@@ -193,13 +198,13 @@ class Geometria:
         Returns:
             El volumen del edificio.
         """
-        filtro = vtk.vtkTriangleFilter()
-        mapper = vtk.vtkPolyDataMapper()
+        filtro = vtkTriangleFilter()
+        mapper = vtkPolyDataMapper()
         filtro.SetInputData(
             self.actores_paredes[ParedEdificioSprfv.BARLOVENTO].poly_data
         )
         mapper.SetInputData(filtro.GetOutput())
-        propiedades = vtk.vtkMassProperties()
+        propiedades = vtkMassProperties()
         propiedades.SetInputConnection(filtro.GetOutputPort())
         propiedades.Update()
         return propiedades.GetSurfaceArea() * abs(self.longitud)
@@ -213,8 +218,18 @@ class Geometria:
         if self.alero_:
             self.alero(0, self.longitud)
 
+    @cached_property
+    def _posiciones_camara(self) -> Tuple[Punto, Dict[PosicionCamara, Punto]]:
+        """Obtiene el punto focal y las posiciones de la cámara. Solo dependen de la geometría, por lo que se calculan
+        una sola vez.
+
+        Returns:
+            El punto focal y las posiciones de la cámara para cada vista.
+        """
+        return posiciones_camara(self.ancho, self.altura_alero, self.longitud)
+
     def setear_posicion_camara(
-        self, camara: vtk.vtkCamera, posicion: PosicionCamara
+        self, camara: vtkCamera, posicion: PosicionCamara
     ) -> None:
         """Setea la posición de la camara.
 
@@ -222,19 +237,8 @@ class Geometria:
             camara: La camara a la que se le setea la vista.
             posicion: La posición a setear.
         """
-        camara.SetFocalPoint(self.ancho / 2, 0, self.longitud / 2)
-        posiciones = {
-            PosicionCamara.SUPERIOR: (
-                self.ancho / 2,
-                self.altura_alero,
-                self.longitud / 2,
-            ),
-            PosicionCamara.PERSPECTIVA: (self.ancho, self.altura_alero, 0),
-            PosicionCamara.IZQUIERDA: (0, 0, self.longitud / 2),
-            PosicionCamara.DERECHA: (self.ancho, 0, self.longitud / 2),
-            PosicionCamara.FRENTE: (self.ancho / 2, 0, 0),
-            PosicionCamara.CONTRAFRENTE: (self.ancho / 2, 0, self.longitud),
-        }
+        punto_focal, posiciones = self._posiciones_camara
+        camara.SetFocalPoint(*punto_focal)
         camara.SetPosition(*posiciones[posicion])
 
         if posicion == PosicionCamara.SUPERIOR:
@@ -381,8 +385,8 @@ class PresionesSprfvMetodoDireccional(Geometria):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        tabla_colores: vtk.vtkLookupTable,
+        renderer: vtkRenderer,
+        tabla_colores: vtkLookupTable,
         edificio: Edificio,
     ) -> None:
         """
@@ -720,8 +724,8 @@ class PresionesComponentes(Geometria):
 
     def __init__(
         self,
-        renderer: vtk.vtkRenderer,
-        tabla_colores: vtk.vtkLookupTable,
+        renderer: vtkRenderer,
+        tabla_colores: vtkLookupTable,
         edificio: Edificio,
     ) -> None:
         """
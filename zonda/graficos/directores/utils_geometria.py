@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union, Tuple
+import math
+from typing import TYPE_CHECKING, Dict, List, Union, Tuple, Sequence
 
 import numpy as np
 import vg
 
+from zonda.enums import PosicionCamara
+
 if TYPE_CHECKING:
     from zonda.tipos import Punto, Punto2D, ParNumerico
 
@@ -33,6 +36,9 @@ def punto_sobre_vector(
     """
     if dist_eucl:
         return fin
+    if not distancia:
+        # El punto coincide con el origen, por lo que no hace falta normalizar el vector.
+        return origen
     _origen = np.array(origen)
     _fin = np.array(fin)
     norm_esc = vg.normalize(_fin - _origen) * distancia
@@ -180,23 +186,15 @@ def coords_zona_cubierta_desde_proyeccion(
         La zona de cubierta.
     """
     dist_inicio, dist_fin = zona
-    array_origen = np.array(
-        origen + (0,)
-    )  # Se le suma la coordenada z ya que lo requiere la función
-    array_punto_inicio_proyectado = np.array(
-        proyeccion_punto_horizontal_sobre_cubierta(dist_inicio, origen, fin) + (0,)
-    )
-    array_punto_fin_proyectado = np.array(
-        proyeccion_punto_horizontal_sobre_cubierta(dist_fin, origen, fin) + (0,)
-    )
-    # noinspection PyTypeChecker
-    dist_inicio_proyectada: float = vg.euclidean_distance(
-        array_origen, array_punto_inicio_proyectado
-    )
-    # noinspection PyTypeChecker
-    dist_fin_proyectada: float = vg.euclidean_distance(
-        array_origen, array_punto_fin_proyectado
+    # Las distancias se calculan con escalares, ya que crear arrays de numpy para puntos de dos o tres coordenadas es
+    # más costoso que la operación en sí.
+    x_origen, y_origen = origen
+    x_inicio, y_inicio = proyeccion_punto_horizontal_sobre_cubierta(
+        dist_inicio, origen, fin
     )
+    x_fin, y_fin = proyeccion_punto_horizontal_sobre_cubierta(dist_fin, origen, fin)
+    dist_inicio_proyectada = math.hypot(x_inicio - x_origen, y_inicio - y_origen)
+    dist_fin_proyectada = math.hypot(x_fin - x_origen, y_fin - y_origen)
     return coords_zona_cubierta(
         origen,
         fin,
@@ -207,3 +205,82 @@ def coords_zona_cubierta_desde_proyeccion(
         dist_eucl=False,
         invertir_sentido=invertir_sentido,
     )
+
+
+def zonas_desde_limites(limites: Sequence[float]) -> np.ndarray:
+    """Crea zonas consecutivas a partir de sus límites, de forma que cada zona termina donde empieza la siguiente.
+
+    Args:
+        limites: Los límites de las zonas, en orden.
+
+    Examples:
+
+        >>> zonas_desde_limites((0, 1, 9, 10))  # Resultado = array([[0., 1.], [1., 9.], [9., 10.]])
+
+    Returns:
+        Un array de forma (cantidad de límites - 1, 2) con los valores de inicio y fin de cada zona.
+    """
+    limites = np.asarray(limites, dtype=float)
+    return np.column_stack((limites[:-1], limites[1:]))
+
+
+def coords_zonas_cubierta_desde_proyeccion(
+    zonas_x: Sequence[ParNumerico],
+    zonas_z: Sequence[ParNumerico],
+    perfil_x: Sequence[float],
+    perfil_y: Sequence[float],
+) -> np.ndarray:
+    """Crea las coordenadas de todas las zonas de cubierta que resultan de combinar las zonas sobre el eje X con las
+    zonas sobre el eje Z, proyectando los valores X sobre el perfil de la cubierta.
+
+    Equivale a llamar a `coords_zona_cubierta_desde_proyeccion` para cada par de zonas, pero todas las coordenadas se
+    calculan juntas.
+
+    Args:
+        zonas_x: Las zonas sobre el eje X, cada una representada por sus valores de inicio y fin.
+        zonas_z: Las zonas sobre el eje Z, cada una representada por sus valores de inicio y fin.
+        perfil_x: Las coordenadas X, en orden creciente, de los puntos que forman el perfil de la cubierta.
+        perfil_y: Las coordenadas Y de los puntos que forman el perfil de la cubierta.
+
+    Returns:
+        Un array de forma (cantidad de zonas Z, cantidad de zonas X, 4, 3) con las coordenadas del poligono de cada zona.
+    """
+    x = np.asarray(zonas_x, dtype=float)
+    z = np.asarray(zonas_z, dtype=float)
+    y = np.interp(x, perfil_x, perfil_y)
+    # Los puntos de cada poligono se ordenan igual que en coords_zona_cubierta: (inicio, z_inicio), (fin, z_inicio),
+    # (fin, z_fin) e (inicio, z_fin).
+    extremos_x = [0, 1, 1, 0]
+    extremos_z = [0, 0, 1, 1]
+    coords = np.empty((len(z), len(x), 4, 3))
+    coords[..., 0] = x[:, extremos_x]
+    coords[..., 1] = y[:, extremos_x]
+    coords[..., 2] = z[:, np.newaxis, extremos_z]
+    return coords
+
+
+def posiciones_camara(
+    ancho: float, altura: float, profundidad: float
+) -> Tuple[Punto, Dict[PosicionCamara, Punto]]:
+    """Calcula el punto focal y la posición de la cámara para cada vista de una estructura.
+
+    Args:
+        ancho: El ancho de la estructura.
+        altura: La altura desde la que se observa la estructura en las vistas superior y en perspectiva.
+        profundidad: La profundidad de la estructura sobre el eje Z.
+
+    Returns:
+        El punto focal y las posiciones de la cámara.
+    """
+    mitad_ancho = ancho / 2
+    mitad_profundidad = profundidad / 2
+    punto_focal = (mitad_ancho, 0, mitad_profundidad)
+    posiciones = {
+        PosicionCamara.SUPERIOR: (mitad_ancho, altura, mitad_profundidad),
+        PosicionCamara.PERSPECTIVA: (ancho, altura, 0),
+        PosicionCamara.IZQUIERDA: (0, 0, mitad_profundidad),
+        PosicionCamara.DERECHA: (ancho, 0, mitad_profundidad),
+        PosicionCamara.FRENTE: (mitad_ancho, 0, 0),
+        PosicionCamara.CONTRAFRENTE: (mitad_ancho, 0, profundidad),
+    }
+    return punto_focal, posiciones
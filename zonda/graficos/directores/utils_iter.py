@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Dict, Callable, Any, Generator, TYPE_CHECKING
+from typing import Sequence, Dict, Callable, Any, Generator, List, Tuple, TYPE_CHECKING
 
 import numpy as np
 
@@ -33,6 +33,50 @@ def aplicar_func_recursivamente(ob: Any, func: Callable, iterable: bool = True)
         return func(ob)
 
 
+def indexar_hojas(ob: Any, es_hoja: Callable[[Any], bool]) -> Tuple[List, Any]:
+    """Separa las hojas de un objeto anidado de su estructura.
+
+    Los diccionarios y las secuencias que no son hojas se recorren. Cada hoja se reemplaza por su índice en la lista de
+    hojas, por lo que la estructura puede volver a armarse con `reconstruir_estructura` luego de procesar todas las
+    hojas juntas. Cualquier secuencia que contenga el objeto es convertida a tuple.
+
+    Args:
+        ob: El objeto a recorrer.
+        es_hoja: Indica si un elemento debe ser tratado como hoja. No debe consumir el elemento si es un iterador.
+
+    Returns:
+        Las hojas en el orden en que fueron encontradas y la estructura con los índices de cada hoja.
+    """
+    hojas = []
+
+    def indexar(ob: Any) -> Any:
+        if isinstance(ob, dict):
+            return {k: indexar(v) for k, v in ob.items()}
+        if es_hoja(ob):
+            hojas.append(ob)
+            return len(hojas) - 1
+        return tuple(indexar(x) for x in ob)
+
+    return hojas, indexar(ob)
+
+
+def reconstruir_estructura(estructura: Any, valores: Sequence) -> Any:
+    """Arma una estructura obtenida con `indexar_hojas` reemplazando cada índice por el valor correspondiente.
+
+    Args:
+        estructura: La estructura con los índices de las hojas.
+        valores: Los valores que reemplazan a cada hoja, en el mismo orden que las hojas.
+
+    Returns:
+        La estructura con los valores.
+    """
+    if isinstance(estructura, dict):
+        return {k: reconstruir_estructura(v, valores) for k, v in estructura.items()}
+    if isinstance(estructura, tuple):
+        return tuple(reconstruir_estructura(x, valores) for x in estructura)
+    return valores[estructura]
+
+
 def aplanar_dict(d: Dict) -> Dict:
     """Aplana un diccionario anidado.
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vtkmodules import all as vtk
+from vtkmodules.vtkCommonCore import vtkLookupTable
 
 from zonda.graficos.actores import ActorBarraEscala, ActorTexto2D
 from zonda.graficos.directores.utils_iter import (
@@ -16,6 +16,7 @@ from zonda.graficos.directores import aisladas as director_aisladas
 from zonda.enums import ExtremoPresion, TipoPresionCubiertaAislada
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindowInteractor
     from zonda.enums import Unidad
     from zonda.cirsoc import CubiertaAislada
 
@@ -28,8 +29,8 @@ class Presiones(PresionesMixin):
 
     def __init__(
         self,
-        interactor: vtk.vtkRenderWindowInteractor,
-        renderer: vtk.vtkRenderer,
+        interactor: vtkRenderWindowInteractor,
+        renderer: vtkRenderer,
         cubierta_aislada: CubiertaAislada,
         unidad: Unidad,
     ) -> None:
@@ -52,7 +53,7 @@ class Presiones(PresionesMixin):
             for p in min_max_valores(presiones=self._presiones)
         )
 
-        tabla_colores = vtk.vtkLookupTable()
+        tabla_colores = vtkLookupTable()
         tabla_colores.SetTableRange(*min_max_presiones)
         tabla_colores.SetHueRange(0.66, 0)
         tabla_colores.Build()
@@ -102,10 +103,15 @@ class Presiones(PresionesMixin):
             regenerar_actores: Indica si los actores deben ser regenerados. Si es False, los actores no se cambian pero
             se actualiza la presión sobre los mismos.
         """
-        if self._actores_actuales is None:
-            self._actores_actuales = self.director.obtener_actores()
         if regenerar_actores:
-            self.ocultar_actores_presion()
+            # Los actores de ambos tipos de presión se crean una única vez en el director, por lo que solo se
+            # intercambian. Los actores que no son del tipo actual ya se encuentran ocultos.
+            if self._actores_actuales is not None:
+                aplicar_func_recursivamente(
+                    self._actores_actuales, lambda actor: actor.ocultar()
+                )
+            self._actores_actuales = self.director.obtener_actores()
+        elif self._actores_actuales is None:
             self._actores_actuales = self.director.obtener_actores()
 
         if self.director.tipo_presion == TipoPresionCubiertaAislada.LOCAL:
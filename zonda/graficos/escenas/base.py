@@ -3,25 +3,25 @@ class PresionesMixin:
         """Aumentar la escala de las flechas para todos los actores de presón."""
         for actor in self._actores_presion:
             actor.flecha.aumentar_escala()
-        self.interactor.ReInitialize()
+        self.interactor.GetRenderWindow().Render()
 
     def disminuir_escala_flechas(self):
         """Disminuye la escala de las flechas para todos los actores de presón."""
         for actor in self._actores_presion:
             actor.flecha.disminuir_escala()
-        self.interactor.ReInitialize()
+        self.interactor.GetRenderWindow().Render()
 
     def aumentar_tamanio_label_presion(self):
         """Aumenta los tamaños de textos en los actores de presión."""
         for actor in self._actores_presion:
             actor.flecha.label.aumentar_tamaño()
-        self.interactor.ReInitialize()
+        self.interactor.GetRenderWindow().Render()
 
     def disminuir_tamanio_label_presion(self):
         """Disminuye los tamaños de textos en los actores de presión."""
         for actor in self._actores_presion:
             actor.flecha.label.disminuir_tamaño()
-        self.interactor.ReInitialize()
+        self.interactor.GetRenderWindow().Render()
 
     def ocultar_actores_presion(self):
         """Oculta los actores de presión en el renderer"""
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
-from vtkmodules import all as vtk
+from vtkmodules.vtkCommonCore import vtkLookupTable
 
 from zonda.graficos.actores import ActorBarraEscala, ActorTexto2D
 from zonda.graficos.directores import cartel as director_cartel
@@ -12,6 +11,7 @@ from zonda.graficos.escenas.edificio import obtener_actores_presion_en_renderer
 from zonda.unidades import convertir_unidad
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindowInteractor
     from zonda.enums import Unidad
     from zonda.cirsoc import Cartel
 
@@ -24,8 +24,8 @@ class Presiones(PresionesMixin):
 
     def __init__(
         self,
-        interactor: vtk.vtkRenderWindowInteractor,
-        renderer: vtk.vtkRenderer,
+        interactor: vtkRenderWindowInteractor,
+        renderer: vtkRenderer,
         cartel: Cartel,
         unidad_presion: Unidad,
         unidad_fuerza: Unidad,
@@ -44,13 +44,14 @@ class Presiones(PresionesMixin):
         self.unidad_presion = unidad_presion
 
         self._presiones = cartel.presiones()
-        self._alturas = cartel.geometria.alturas
+        # Las alturas no se repiten, por lo que la presión de cada altura se obtiene directamente del diccionario.
+        self._presion_por_altura = dict(zip(cartel.geometria.alturas, self._presiones))
 
-        tabla_colores = vtk.vtkLookupTable()
+        tabla_colores = vtkLookupTable()
         tabla_colores.SetTableRange(
             (
-                convertir_unidad(min(self._presiones), self.unidad_presion),
-                convertir_unidad(max(self._presiones), self.unidad_presion),
+                convertir_unidad(self._presiones.min(), self.unidad_presion),
+                convertir_unidad(self._presiones.max(), self.unidad_presion),
             )
         )
         tabla_colores.SetHueRange(0.66, 0)
@@ -77,9 +78,8 @@ class Presiones(PresionesMixin):
         Args:
             altura: La altura a la que actualizar la presión.
         """
-
-        presion = self._presiones[np.where(self._alturas == altura)][0]
+        presion = self._presion_por_altura[altura]
         self._actor.asignar_presion(
             presion, str_extra=f"({altura} m)", unidad=self.unidad_presion
         )
-        self.interactor.ReInitialize()
+        self.interactor.GetRenderWindow().Render()
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, Tuple
 
-from vtkmodules import all as vtk
+from vtkmodules.vtkCommonCore import vtkLookupTable
 
 from zonda.enums import (
     DireccionVientoMetodoDireccionalSprfv,
@@ -28,19 +28,20 @@ from zonda.graficos.escenas.base import PresionesMixin
 from zonda.unidades import convertir_unidad
 
 if TYPE_CHECKING:
+    from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindowInteractor
     from zonda.cirsoc import Edificio
     from zonda.cirsoc.presiones.edificio import PresionesEdificio
     from zonda.enums import Unidad
 
 
 def obtener_actores_presion_en_renderer(
-    renderer: vtk.vtkRenderer,
+    renderer: vtkRenderer,
 ) -> Tuple[ActorPresion, ...]:
     """Obtiene todos los actores de presión presentes en el renderer."""
     return tuple(
         actor
         for actor in renderer.GetActors()
-        if isinstance(actor, ActorPresion) and hasattr(actor, "flecha")
+        if isinstance(actor, ActorPresion) and actor.tiene_flecha
     )
 
 
@@ -53,8 +54,8 @@ class PresionesSprfvMetodoDireccional(PresionesMixin):
 
     def __init__(
         self,
-        interactor: vtk.vtkRenderWindowInteractor,
-        renderer: vtk.vtkRenderer,
+        interactor: vtkRenderWindowInteractor,
+        renderer: vtkRenderer,
         edificio: Edificio,
         unidad: Unidad,
     ) -> None:
@@ -91,7 +92,7 @@ class PresionesSprfvMetodoDireccional(PresionesMixin):
             convertir_unidad(p, self.unidad) for p in min_max_valores(**presiones)
         )
 
-        tabla_colores = vtk.vtkLookupTable()
+        tabla_colores = vtkLookupTable()
         tabla_colores.SetTableRange(*min_max_presiones)
         tabla_colores.SetHueRange(0.66, 0)
         tabla_colores.Build()
@@ -402,8 +403,8 @@ class PresionesComponentes(PresionesMixin):
 
     def __init__(
         self,
-        interactor: vtk.vtkRenderWindowInteractor,
-        renderer: vtk.vtkRenderer,
+        interactor: vtkRenderWindowInteractor,
+        renderer: vtkRenderer,
         edificio: Edificio,
         unidad: Unidad,
     ) -> None:
@@ -444,7 +445,7 @@ class PresionesComponentes(PresionesMixin):
             convertir_unidad(p, self.unidad) for p in min_max_valores(**presiones)
         )
 
-        tabla_colores = vtk.vtkLookupTable()
+        tabla_colores = vtkLookupTable()
         tabla_colores.SetTableRange(*min_max_presiones)
         tabla_colores.SetHueRange(0.66, 0)
         tabla_colores.Build()
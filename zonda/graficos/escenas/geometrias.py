@@ -6,7 +6,11 @@ from zonda.enums import Estructura, PosicionCamara
 from zonda.graficos.directores import edificio, aisladas, cartel
 
 if TYPE_CHECKING:
-    from vtkmodules import all as vtk
+    from vtkmodules.vtkRenderingCore import (
+        vtkCamera,
+        vtkRenderer,
+        vtkRenderWindowInteractor,
+    )
 
 
 class Geometria:
@@ -16,9 +20,9 @@ class Geometria:
 
     def __init__(
         self,
-        interactor: vtk.vtkRenderWindowInteractor,
-        renderer: vtk.vtkRenderer,
-        camara: vtk.vtkCamera,
+        interactor: vtkRenderWindowInteractor,
+        renderer: vtkRenderer,
+        camara: vtkCamera,
         estructura: Estructura,
     ) -> None:
         """
@@ -34,6 +38,7 @@ class Geometria:
         self.camara = camara
         self.director = None
         self._parametros_camara = None
+        self._parametros_director = None
         dict_directores = {
             Estructura.EDIFICIO: edificio.Geometria,
             Estructura.CUBIERTA_AISLADA: aisladas.Geometria,
@@ -42,15 +47,20 @@ class Geometria:
         self._clase_director = dict_directores[estructura]
 
     def generar(self, *args, **kwargs) -> None:
+        posicion_camara = (
+            kwargs.pop("posicion_camara", None) or PosicionCamara.PERSPECTIVA
+        )
+        parametros = (args, kwargs)
+        if self.director is not None and parametros == self._parametros_director:
+            # La geometría no cambió, por lo que se mantienen los actores existentes en lugar de volver a crearlos.
+            return
+        self._parametros_director = parametros
         if self.director is not None:
             self._parametros_camara = {
                 "punto_focal": self.camara.GetFocalPoint(),
                 "posicion": self.camara.GetPosition(),
                 "vector_altura": self.camara.GetViewUp(),
             }
-        posicion_camara = (
-            kwargs.pop("posicion_camara", None) or PosicionCamara.PERSPECTIVA
-        )
         self.director = self._clase_director(self.renderer, *args, **kwargs)
         self.director.inicializar_actores()
         if self._parametros_camara is not None:
@@ -3,10 +3,9 @@ from os.path import dirname
 sys.path.append(dirname(dirname(__file__)))
 
 from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtGui import QFontDatabase, QIcon
+from PyQt5.QtGui import QFontDatabase, QIcon, QPixmap
 
 from zonda import __acercade__, recursos
-from zonda.widgets.zonda import WidgetBienvenida
 
 
 def main():
@@ -22,9 +21,22 @@ def main():
 
     qss = QtCore.QFile(":/qss/zonda.qss")
     if qss.open(QtCore.QFile.ReadOnly):
-        app.setStyleSheet(qss.readAll().data().decode("utf-8"))
+        # QTextStream devuelve el contenido directamente como str, sin pasar por una copia intermedia en bytes.
+        stream = QtCore.QTextStream(qss)
+        stream.setCodec("UTF-8")
+        app.setStyleSheet(stream.readAll())
+        qss.close()
+
+    # Los widgets importan toda la parte gráfica (VTK) y de cálculo, lo que demora el inicio. Se muestra una pantalla
+    # de presentación mientras se importan.
+    splash = QtWidgets.QSplashScreen(QPixmap(":/imagenes/logo.png"))
+    splash.show()
+    app.processEvents()
+
+    from zonda.widgets.zonda import WidgetBienvenida
 
     widget = WidgetBienvenida()
+    splash.finish(widget)
 
     app.exec_()
 
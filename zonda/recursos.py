@@ -10640,58 +10640,57 @@ qt_resource_data = b"\
 \x73\x20\x67\x72\x61\x76\x69\x64\x61\x20\x65\x6e\x69\x6d\x2c\x20\
 \x76\x65\x6c\x20\x6c\x61\x63\x69\x6e\x69\x61\x20\x65\x72\x61\x74\
 \x20\x6f\x64\x69\x6f\x20\x75\x74\x20\x61\x75\x67\x75\x65\x2e\
-\x00\x00\x03\x1f\
+\x00\x00\x03\x0c\
 \x00\
-\x00\x0e\x8e\x78\x9c\xd5\x57\xcf\x6f\xda\x30\x14\xbe\x23\xf1\x3f\
-\x58\xe5\xb2\x56\x84\x12\x20\x94\x86\xd3\xba\xb5\xa7\x49\x6b\xb5\
-\x49\x3b\x3b\xb1\x03\x56\x8d\x4d\x1d\x67\xc0\xaa\xfd\xef\x73\x62\
-\x12\xd9\x89\x43\x56\xad\x53\xb7\xf8\x10\xf1\xec\xf7\xbd\xef\x3d\
-\xbf\x1f\xa1\xdf\x7b\xb8\xcf\xd2\xf5\x4d\x26\x25\x67\xe1\x56\xe0\
-\x34\xc5\xa8\xdf\x7b\xee\xf7\x80\x7a\x22\x18\x3f\xae\x04\xcf\x18\
-\xf2\x62\x4e\xb9\x08\xc1\x60\x9e\x44\x30\x09\x96\xfd\xde\xcf\x7e\
-\xaf\x6f\x2a\x8f\x28\x5f\x11\x56\xa9\x1e\xcf\xef\xd6\x44\xe2\x65\
-\x1b\xda\x13\x25\x0c\x43\xb1\x12\x10\x11\xcc\xe4\xbb\xbd\x1f\x82\
-\xf1\x10\x1c\xf4\x6b\x3f\xd1\xbf\xd4\xcb\x1f\x6a\x88\xee\x27\x95\
-\x7c\xab\xd4\xc0\xc0\x5f\x04\x0b\xb8\x18\x1e\x05\x7e\x29\x38\x3f\
-\x92\x49\x38\x93\x5e\x4a\x7e\x60\xb5\x37\xdf\xee\x4b\x8a\x5c\x20\
-\xac\x88\xf9\xdb\x3d\x48\x39\x25\x48\xa9\xc1\x7c\x59\xfb\x5e\xce\
-\x37\x4b\x43\x30\xa9\x14\xb7\x10\x21\xc2\x56\x4a\x73\x5c\xc8\xdc\
-\xd1\x09\xd7\xfc\xbb\x82\xef\x0e\xf3\x5f\x0d\xcc\x64\xe6\x5f\x45\
-\x66\x60\x0a\xc1\x79\x3b\xeb\xff\x8d\x6f\x11\xe5\x37\x62\x3b\xf3\
-\xe7\x57\xd7\x81\xc1\x56\x0b\x5c\x6c\x07\x10\x3d\x65\x44\x10\xe1\
-\x51\x12\x63\x16\x13\x58\x71\x36\xb3\xd3\x6f\x26\x59\xe0\xce\xb1\
-\x14\x52\x22\xea\x15\x18\x51\xe5\xff\x9b\x54\x60\x5c\x3c\x46\x28\
-\xb4\xc0\x55\x81\xfe\x2b\x56\xe0\xa9\xe0\xfc\x13\x05\xa8\xba\x90\
-\x5a\x46\x5c\xb4\xc0\x99\xd0\x06\xeb\x37\x62\x8b\xae\xf3\x65\xb0\
-\xd5\x02\x27\xdb\x0d\x47\x19\xe5\xe0\xd9\xbe\x4a\xc6\x59\xfb\x08\
-\x30\x36\x3b\x7b\xa8\x86\xd7\xd1\x28\x8d\x5c\x5e\x9c\x98\x52\xe0\
-\xe2\xd2\x82\xf6\xb4\x0f\xdd\xe8\x65\x86\x80\xd6\x90\x53\xb2\x5a\
-\x4b\x15\xf0\xc3\xd2\x65\xc1\x74\xe0\x13\x8c\x30\xad\x85\xa6\xe4\
-\x69\xa5\xb6\x51\x10\x00\xf8\x8b\x2a\xb3\x0b\xf9\x0e\xe7\x06\xf3\
-\x78\x89\x0d\xa4\xe6\x4e\x02\x37\x84\x1e\x42\x70\xf6\x39\xdd\x41\
-\x8a\xce\x6c\xc3\x03\xe5\x0d\x49\x48\x0c\x19\xe2\x55\x9f\x01\xcd\
-\x36\x03\xcc\x31\xf8\x72\x8b\xf9\xde\x46\x65\x20\x61\x3a\x02\x93\
-\x46\x04\x06\x58\x08\x2e\x3c\x98\xc9\xb5\xdb\xfc\xc4\x6d\x3e\xe2\
-\x14\x2d\xed\xa8\xc1\x60\x7a\x35\x45\x9d\x56\x55\x4d\xdc\x22\x22\
-\xc3\x84\xc7\x59\x3a\x04\x0f\xef\xa3\x54\x0a\x18\xcb\x2f\x5b\xc2\
-\x6e\xf8\x5e\xcb\xdb\x6f\x78\x80\x03\x1c\x25\xd3\x06\x9e\x1e\x32\
-\x0e\x1f\x8c\x00\x5a\xd9\x10\x34\xc4\x11\x57\x19\xb7\xb1\x5b\xd5\
-\x07\xbe\x89\xb8\xa2\x55\x95\x79\x8a\x29\x8e\x25\xe1\xcc\x3b\xf5\
-\x19\x66\x9f\xac\xf5\x7c\x8d\xfc\x95\x73\xaa\x73\xdc\xae\x4c\x6f\
-\x47\x90\x5c\xab\x22\xaf\x35\x5f\x2f\x95\x07\xaa\xfc\x29\xda\x6f\
-\xbd\x36\x67\xf5\xc3\x4e\x46\xfa\x52\xca\xf6\x5c\xa7\x11\xc6\x6b\
-\x1c\x3f\x62\xa4\xee\xc4\x10\x5a\x85\xf7\x1b\xb7\xd2\x74\xc4\x77\
-\x5b\x2b\x80\xdb\x01\x6f\x27\x77\xd3\xbb\x8f\x9d\x80\x77\x02\x6e\
-\xf0\x48\xe0\x38\x83\x48\x34\x7a\x9c\x31\xae\xd0\x22\x5f\xa5\xde\
-\x37\x82\x56\x58\xde\x43\x86\xe9\xa9\x54\x9b\xe7\xcb\xe6\x50\x26\
-\x89\x01\x0d\xe7\xf9\xb2\xa1\x6f\xb8\xf2\xd1\xc6\x7f\x61\xdf\x7d\
-\xdd\x2e\x50\xe6\x38\xc5\x89\xac\x2a\xd2\xdc\x10\x1a\xd0\xac\xd5\
-\xba\x27\x9d\x03\x6f\x10\x8f\xf3\xd5\xa6\x3f\x82\x71\x4c\x8c\x74\
-\x6f\xea\x27\x38\xc2\xe3\xf1\x1f\x06\xfc\x68\xc6\x1e\x48\xae\xdb\
-\x9d\xc1\xa8\x30\xd6\x86\x23\x61\x64\x83\x34\xdc\x3c\x79\x89\xed\
-\xa0\xc7\x42\x6b\x8c\x9d\xe2\xaf\x90\xdb\xfb\xc0\xf8\xf0\x32\x8f\
-\x39\x5a\x5a\x61\x77\x54\x0e\x98\x9a\x91\x95\xc0\x98\x55\x87\x18\
-\x6f\x39\x26\x30\x2a\x0f\xf5\x7b\xbf\x00\x26\xba\x1d\xae\
+\x00\x0e\x44\x78\x9c\xd5\x57\x51\x6f\xda\x30\x10\x7e\x47\xe2\x3f\
+\x58\xe5\x65\xad\x48\x4b\x80\x00\x0d\x4f\xeb\xd6\x3e\x4d\x5a\xab\
+\x4d\xda\xb3\x63\x3b\x60\xd5\xd8\xd4\x71\x06\xac\xda\x7f\x9f\x13\
+\x13\x64\x27\x0e\xac\x5a\xa7\x6e\xf1\x03\xe2\x9c\xfb\xee\xbb\xcf\
+\x77\x67\xe8\x76\x1e\xee\xf3\x6c\x79\x93\x2b\x25\x78\xbc\x96\x24\
+\xcb\x08\xee\x76\x9e\xbb\x1d\xa0\x9f\x04\xa2\xc7\x85\x14\x39\xc7\
+\x01\x12\x4c\xc8\x18\xf4\x26\x69\x02\xd3\x68\xde\xed\xfc\xec\x76\
+\xba\xb6\xf3\x25\x13\x0b\xca\x0f\xae\xfb\xf7\x37\x4b\xaa\xc8\xbc\
+\x0d\xed\x89\x51\x4e\xa0\x5c\x48\x88\x29\xe1\xea\xdd\x36\x8c\xc1\
+\xa0\x0f\x76\xe6\x63\x3b\x34\xdf\xf4\x47\xd8\x37\x10\xa7\x9f\x4c\
+\x89\xb5\x76\x03\xbd\x70\x16\xcd\xe0\xac\xbf\x37\x84\x95\xe1\x7c\
+\x4f\x26\x15\x5c\x05\x19\xfd\x41\xf4\xde\x64\xbd\xad\x28\x0a\x89\
+\x89\x26\x16\xae\xb7\x20\x13\x8c\x62\xed\x06\x8b\xe5\xec\x07\x05\
+\xdf\x3c\x8b\xc1\xf0\xe0\xb8\x86\x18\x53\xbe\xd0\x9e\x83\xd2\xe6\
+\x57\x27\x5e\x8a\xef\x1a\xfe\xb4\xcc\x7f\x55\x98\xe1\x38\x9c\x26\
+\xb6\x30\xa5\xe1\xbc\x9d\xf5\xff\xc6\xb7\x54\xf9\x8d\xd8\x8e\xc3\
+\xc9\xf4\x3a\xb2\xd8\x1a\x83\x8f\x6d\x0f\xe2\xa7\x9c\x4a\x2a\x03\
+\x46\x11\xe1\x88\xc2\x03\x67\xbb\x3a\xc3\x66\x91\x45\xfe\x1a\xcb\
+\x20\xa3\xb2\xde\x81\x09\xd3\xf9\xbf\x49\x07\xa2\xf2\xb1\xa4\x30\
+\x06\x5f\x07\x86\xaf\xd8\x81\xc7\xc4\xf9\x27\x1a\x50\x4f\x21\xbd\
+\x2c\x5d\x8c\xc1\x5b\xd0\x16\xeb\x37\x62\x8b\xaf\x8b\x65\xb1\x35\
+\x06\x2f\xdb\x95\xc0\x39\x13\xe0\xd9\x3d\x4a\x2e\x78\xfb\x15\x60\
+\x6d\x9e\x9c\xa1\x06\xde\xa8\x51\x05\xb9\xba\x38\x72\x4b\x81\x8b\
+\x2b\x07\x3a\x30\x39\x9c\x46\xaf\x2a\x04\xb4\x4a\xce\xe8\x62\xa9\
+\xb4\xe0\xbb\xb9\x2f\x82\x9d\xc0\x27\x98\x10\x56\x93\xa6\xe2\xe9\
+\x94\xb6\xd5\x10\x00\x84\xb3\x43\x65\x97\xf6\x0d\x29\x02\x16\x7a\
+\xc9\x15\x64\xf6\x4e\x0a\x57\x94\xed\x62\x70\xf6\x39\xdb\x40\x86\
+\xcf\xdc\xc0\x3d\x9d\x0d\x4d\x29\x82\x1c\x8b\xc3\x9c\x01\xcd\x31\
+\x03\xec\x6b\xf0\xe5\x11\x8b\xbd\x95\xae\x40\xca\x8d\x02\xc3\x86\
+\x02\x3d\x22\xa5\x90\x01\xcc\xd5\xd2\x1f\x7e\xe8\x0f\x9f\x08\x86\
+\xe7\xae\x6a\x30\x1a\x4d\x47\xf8\x64\x54\xdd\x13\xb7\x98\xaa\x38\
+\x15\x28\xcf\xfa\xe0\xe1\x7d\x92\x29\x09\x91\xfa\xb2\xa6\xfc\x46\
+\x6c\x8d\xbd\xfd\x84\x7b\x24\x22\x49\x3a\x6a\xe0\x99\x4b\xc6\x93\
+\x83\x25\xa0\x53\x0d\x51\xc3\x9c\x08\x5d\x71\x2b\x77\x54\x7d\x10\
+\xab\x44\x68\x5a\x87\x36\xcf\x08\x23\x48\x51\xc1\x83\x63\x3f\xc3\
+\xdc\x37\x6b\x33\xdf\x20\x7f\x15\x82\x99\x1a\x77\x3b\x33\xd8\x50\
+\xac\x96\xba\xc9\x6b\xc3\x37\xc8\xd4\x8e\xe9\x7c\xca\xf1\x5b\xef\
+\xcd\x71\xfd\x65\x2f\x23\x73\x28\xd5\x78\xae\xd3\x88\xd1\x92\xa0\
+\x47\x82\xf5\x99\x58\x46\xa7\xf1\x7e\xe3\x54\x9a\x89\x84\xfe\x68\
+\x25\x70\x3b\xe0\xed\xf0\x6e\x74\xf7\xf1\x24\xe0\x9d\x84\x2b\x72\
+\x29\x09\xca\x21\x96\x8d\x19\x67\x5d\x57\x78\x56\xac\xca\xef\x1b\
+\xc5\x0b\xa2\xee\x21\x27\xec\x58\xa9\x4d\x8a\xe5\x72\xa8\x8a\xc4\
+\x82\x86\x93\x62\xb9\xd0\x37\x42\xe7\xe8\xe2\xbf\x70\xee\xbe\xee\
+\x14\xa8\x6a\x9c\x91\x54\x1d\x3a\xd2\xde\x90\x06\xd0\xee\xd5\x7a\
+\x26\x27\x2f\xbc\x1e\x1a\x14\xab\xcd\xff\x12\x22\x44\xad\x72\x6f\
+\xfa\xa7\x24\x21\x83\xc1\x1f\x0a\xbe\x0f\xe3\x5e\x48\xbe\xd3\x1d\
+\xc3\xa4\x0c\xd6\x86\xa3\x60\xe2\x82\x34\xd2\x3c\x7a\x88\xed\xa0\
+\xfb\x46\x6b\x5c\x3b\xe5\x5f\x21\x7f\xf6\x91\xf5\xc3\xcb\x7e\xcd\
+\x33\xd2\xca\xb8\xdd\xce\x2f\x28\x3d\x09\x47\
 \x00\x00\x26\x8f\
 \xff\
 \xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
@@ -39554,47 +39553,47 @@ qt_resource_struct_v1 = b"\
 \x00\x00\x00\x6c\x00\x02\x00\x00\x00\x01\x00\x00\x00\x08\
 \x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
 \x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x02\x88\xe2\
-\x00\x00\x05\x44\x00\x00\x00\x00\x00\x01\x00\x05\xd2\x92\
-\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x05\xca\xf2\
-\x00\x00\x02\x8e\x00\x00\x00\x00\x00\x01\x00\x05\x97\x36\
-\x00\x00\x04\x54\x00\x00\x00\x00\x00\x01\x00\x05\xc0\x33\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x05\xd0\x62\
-\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x05\xba\x83\
-\x00\x00\x04\x30\x00\x00\x00\x00\x00\x01\x00\x05\xbb\xce\
-\x00\x00\x03\x6e\x00\x00\x00\x00\x00\x01\x00\x05\xae\xdd\
-\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x05\xdc\xf5\
-\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x05\xa5\xd6\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x05\xed\x60\
-\x00\x00\x06\x3e\x00\x00\x00\x00\x00\x01\x00\x05\xe4\x2b\
-\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x05\x94\xa9\
-\x00\x00\x05\xbe\x00\x00\x00\x00\x00\x01\x00\x05\xdb\x70\
-\x00\x00\x05\x9a\x00\x00\x00\x00\x00\x01\x00\x05\xd8\xda\
-\x00\x00\x03\x52\x00\x00\x00\x00\x00\x01\x00\x05\xaa\xe3\
-\x00\x00\x02\xa8\x00\x00\x00\x00\x00\x01\x00\x05\x9a\x86\
-\x00\x00\x04\xf2\x00\x00\x00\x00\x00\x01\x00\x05\xcd\x1a\
-\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x05\xa7\xf9\
-\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x05\xa3\xbc\
-\x00\x00\x04\x7e\x00\x00\x00\x00\x00\x01\x00\x05\xc4\x5a\
-\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x05\xc8\xb5\
-\x00\x00\x03\xf0\x00\x00\x00\x00\x00\x01\x00\x05\xb7\x7f\
-\x00\x00\x03\xc2\x00\x00\x00\x00\x00\x01\x00\x05\xb4\x74\
-\x00\x00\x05\x66\x00\x00\x00\x00\x00\x01\x00\x05\xd4\xbf\
-\x00\x00\x06\x0c\x00\x00\x00\x00\x00\x01\x00\x05\xe0\xb6\
-\x00\x00\x05\x82\x00\x00\x00\x00\x00\x01\x00\x05\xd5\xc0\
-\x00\x00\x03\x96\x00\x00\x00\x00\x00\x01\x00\x05\xb2\x57\
+\x00\x00\x05\x44\x00\x00\x00\x00\x00\x01\x00\x05\xd2\x7f\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x05\xca\xdf\
+\x00\x00\x02\x8e\x00\x00\x00\x00\x00\x01\x00\x05\x97\x23\
+\x00\x00\x04\x54\x00\x00\x00\x00\x00\x01\x00\x05\xc0\x20\
+\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x05\xd0\x4f\
+\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x05\xba\x70\
+\x00\x00\x04\x30\x00\x00\x00\x00\x00\x01\x00\x05\xbb\xbb\
+\x00\x00\x03\x6e\x00\x00\x00\x00\x00\x01\x00\x05\xae\xca\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x05\xdc\xe2\
+\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x05\xa5\xc3\
+\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x05\xed\x4d\
+\x00\x00\x06\x3e\x00\x00\x00\x00\x00\x01\x00\x05\xe4\x18\
+\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x05\x94\x96\
+\x00\x00\x05\xbe\x00\x00\x00\x00\x00\x01\x00\x05\xdb\x5d\
+\x00\x00\x05\x9a\x00\x00\x00\x00\x00\x01\x00\x05\xd8\xc7\
+\x00\x00\x03\x52\x00\x00\x00\x00\x00\x01\x00\x05\xaa\xd0\
+\x00\x00\x02\xa8\x00\x00\x00\x00\x00\x01\x00\x05\x9a\x73\
+\x00\x00\x04\xf2\x00\x00\x00\x00\x00\x01\x00\x05\xcd\x07\
+\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x05\xa7\xe6\
+\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x05\xa3\xa9\
+\x00\x00\x04\x7e\x00\x00\x00\x00\x00\x01\x00\x05\xc4\x47\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x05\xc8\xa2\
+\x00\x00\x03\xf0\x00\x00\x00\x00\x00\x01\x00\x05\xb7\x6c\
+\x00\x00\x03\xc2\x00\x00\x00\x00\x00\x01\x00\x05\xb4\x61\
+\x00\x00\x05\x66\x00\x00\x00\x00\x00\x01\x00\x05\xd4\xac\
+\x00\x00\x06\x0c\x00\x00\x00\x00\x00\x01\x00\x05\xe0\xa3\
+\x00\x00\x05\x82\x00\x00\x00\x00\x00\x01\x00\x05\xd5\xad\
+\x00\x00\x03\x96\x00\x00\x00\x00\x00\x01\x00\x05\xb2\x44\
 \x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x02\x69\xb6\
 \x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x02\x56\x44\
 \x00\x00\x00\xd6\x00\x01\x00\x00\x00\x01\x00\x02\x63\x79\
 \x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x02\x7a\xbe\
 \x00\x00\x01\x02\x00\x01\x00\x00\x00\x01\x00\x02\x71\x9f\
-\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x05\x75\x5d\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x07\x23\
-\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x02\xc1\x3c\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xba\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x7b\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x02\x9a\xa9\
+\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x05\x75\x4a\
+\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x07\x10\
+\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x02\xc1\x29\
+\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xa7\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x68\
+\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x02\x9a\x96\
 \x00\x00\x01\x7a\x00\x01\x00\x00\x00\x01\x00\x02\x97\x86\
-\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x05\x82\xe1\
+\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x05\x82\xce\
 "
 
 qt_resource_struct_v2 = b"\
@@ -39618,61 +39617,61 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
 \x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x02\x88\xe2\
 \x00\x00\x01\x75\x1f\x79\xfd\x76\
-\x00\x00\x05\x44\x00\x00\x00\x00\x00\x01\x00\x05\xd2\x92\
+\x00\x00\x05\x44\x00\x00\x00\x00\x00\x01\x00\x05\xd2\x7f\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x05\xca\xf2\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x05\xca\xdf\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x02\x8e\x00\x00\x00\x00\x00\x01\x00\x05\x97\x36\
+\x00\x00\x02\x8e\x00\x00\x00\x00\x00\x01\x00\x05\x97\x23\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\x54\x00\x00\x00\x00\x00\x01\x00\x05\xc0\x33\
+\x00\x00\x04\x54\x00\x00\x00\x00\x00\x01\x00\x05\xc0\x20\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x05\xd0\x62\
+\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x05\xd0\x4f\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x05\xba\x83\
+\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x05\xba\x70\
 \x00\x00\x01\x75\x2c\x77\x9e\x7e\
-\x00\x00\x04\x30\x00\x00\x00\x00\x00\x01\x00\x05\xbb\xce\
+\x00\x00\x04\x30\x00\x00\x00\x00\x00\x01\x00\x05\xbb\xbb\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\x6e\x00\x00\x00\x00\x00\x01\x00\x05\xae\xdd\
+\x00\x00\x03\x6e\x00\x00\x00\x00\x00\x01\x00\x05\xae\xca\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x05\xdc\xf5\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x05\xdc\xe2\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x05\xa5\xd6\
+\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x05\xa5\xc3\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x05\xed\x60\
+\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x05\xed\x4d\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x06\x3e\x00\x00\x00\x00\x00\x01\x00\x05\xe4\x2b\
+\x00\x00\x06\x3e\x00\x00\x00\x00\x00\x01\x00\x05\xe4\x18\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x05\x94\xa9\
+\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x05\x94\x96\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\xbe\x00\x00\x00\x00\x00\x01\x00\x05\xdb\x70\
+\x00\x00\x05\xbe\x00\x00\x00\x00\x00\x01\x00\x05\xdb\x5d\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\x9a\x00\x00\x00\x00\x00\x01\x00\x05\xd8\xda\
+\x00\x00\x05\x9a\x00\x00\x00\x00\x00\x01\x00\x05\xd8\xc7\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\x52\x00\x00\x00\x00\x00\x01\x00\x05\xaa\xe3\
+\x00\x00\x03\x52\x00\x00\x00\x00\x00\x01\x00\x05\xaa\xd0\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x02\xa8\x00\x00\x00\x00\x00\x01\x00\x05\x9a\x86\
+\x00\x00\x02\xa8\x00\x00\x00\x00\x00\x01\x00\x05\x9a\x73\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\xf2\x00\x00\x00\x00\x00\x01\x00\x05\xcd\x1a\
+\x00\x00\x04\xf2\x00\x00\x00\x00\x00\x01\x00\x05\xcd\x07\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x05\xa7\xf9\
+\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x05\xa7\xe6\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x05\xa3\xbc\
+\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x05\xa3\xa9\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\x7e\x00\x00\x00\x00\x00\x01\x00\x05\xc4\x5a\
+\x00\x00\x04\x7e\x00\x00\x00\x00\x00\x01\x00\x05\xc4\x47\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x05\xc8\xb5\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x05\xc8\xa2\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\xf0\x00\x00\x00\x00\x00\x01\x00\x05\xb7\x7f\
+\x00\x00\x03\xf0\x00\x00\x00\x00\x00\x01\x00\x05\xb7\x6c\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\xc2\x00\x00\x00\x00\x00\x01\x00\x05\xb4\x74\
+\x00\x00\x03\xc2\x00\x00\x00\x00\x00\x01\x00\x05\xb4\x61\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\x66\x00\x00\x00\x00\x00\x01\x00\x05\xd4\xbf\
+\x00\x00\x05\x66\x00\x00\x00\x00\x00\x01\x00\x05\xd4\xac\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x06\x0c\x00\x00\x00\x00\x00\x01\x00\x05\xe0\xb6\
+\x00\x00\x06\x0c\x00\x00\x00\x00\x00\x01\x00\x05\xe0\xa3\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x05\x82\x00\x00\x00\x00\x00\x01\x00\x05\xd5\xc0\
+\x00\x00\x05\x82\x00\x00\x00\x00\x00\x01\x00\x05\xd5\xad\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x03\x96\x00\x00\x00\x00\x00\x01\x00\x05\xb2\x57\
+\x00\x00\x03\x96\x00\x00\x00\x00\x00\x01\x00\x05\xb2\x44\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
 \x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x02\x69\xb6\
 \x00\x00\x01\x75\x1f\x79\xfd\x76\
@@ -39684,21 +39683,21 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x01\x75\x1f\x79\xfd\x76\
 \x00\x00\x01\x02\x00\x01\x00\x00\x00\x01\x00\x02\x71\x9f\
 \x00\x00\x01\x75\x52\xa5\x84\x9f\
-\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x05\x75\x5d\
+\x00\x00\x02\x20\x00\x00\x00\x00\x00\x01\x00\x05\x75\x4a\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x07\x23\
+\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x07\x10\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x02\xc1\x3c\
+\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x02\xc1\x29\
 \x00\x00\x01\x75\x3c\x7e\x1b\x40\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xba\
+\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xa7\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x7b\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x68\
 \x00\x00\x01\x75\x1f\x79\xfd\x76\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x02\x9a\xa9\
+\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x02\x9a\x96\
 \x00\x00\x01\x75\x3c\x7e\xa3\xae\
 \x00\x00\x01\x7a\x00\x01\x00\x00\x00\x01\x00\x02\x97\x86\
 \x00\x00\x01\x75\x51\x51\x11\xe8\
-\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x05\x82\xe1\
+\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x05\x82\xce\
 \x00\x00\x01\x75\x1f\x79\xfd\x67\
 "
 
@@ -1,19 +1,24 @@
 from zonda.enums import Unidad
 
+# Factores para convertir un valor en Newtons a cada unidad. Los valores en Newtons se devuelven sin modificar.
+_FACTORES_CONVERSION = {
+    Unidad.KN: 0.001,
+    Unidad.KG: 0.1019716213,
+}
+
 
 def convertir_unidad(valor: float, unidad: Unidad) -> float:
     """Convierte un valor de N a la unidad especificada.
 
     Args:
-        valor: El valor a convertir en Newtons.
+        valor: El valor a convertir en Newtons. También puede ser un array de numpy, en cuyo caso se convierten todos
+            sus valores.
         unidad: La unidad a la que se convierte.
 
     Returns:
 
     """
-    if unidad == Unidad.N:
+    factor = _FACTORES_CONVERSION.get(unidad)
+    if factor is None:
         return valor
-    if unidad == Unidad.KN:
-        return valor * 0.001
-    if unidad == Unidad.KG:
-        return valor * 0.1019716213
+    return valor * factor
@@ -1,6 +1,6 @@
 from typing import Dict, Union, Optional, Tuple
 
-from PyQt5 import QtWidgets, QtCore
+from PyQt5 import QtWidgets, QtCore, QtGui
 
 from zonda import excepciones
 from zonda.cirsoc import geometria
@@ -15,6 +15,60 @@ from zonda.enums import (
 )
 from zonda.widgets.graficos import WidgetGraficoGeometria
 
+# Textos y valores de los items de cada combobox. Solo dependen de los enums, por lo que se generan una única vez.
+_ITEMS_CATEGORIA = tuple((enum.value, enum) for enum in CategoriaEstructura)
+_ITEMS_TIPO_CUBIERTA = tuple((enum.value.title(), enum) for enum in TipoCubierta)
+_ITEMS_TIPO_CUBIERTA_AISLADA = tuple(
+    (enum.value.title(), enum)
+    for enum in (TipoCubierta.DOS_AGUAS, TipoCubierta.UN_AGUA)
+)
+_ITEMS_CERRAMIENTO = tuple(
+    (enum.value.title(), enum)
+    for enum in (Cerramiento.CERRADO, Cerramiento.PARCIALMENTE_CERRADO)
+)
+_ITEMS_POSICION_BLOQUEO = tuple(
+    (enum.value.title(), enum) for enum in PosicionBloqueoCubierta
+)
+
+# Estilo de los spinboxs cuyo valor es inválido.
+_ESTILO_INVALIDO = "QDoubleSpinBox {background-color:#ff6347;}"
+
+
+def _limpiar_estilo_invalido(*spinboxs: QtWidgets.QDoubleSpinBox) -> None:
+    """Quita el estilo de valor inválido de los spinboxs.
+
+    Solo se modifican los spinboxs que tienen un estilo asignado, ya que cambiar la hoja de estilo de un widget obliga a
+    Qt a volver a aplicarle el estilo, aunque la hoja de estilo ya esté vacía.
+
+    Args:
+        *spinboxs: Los spinboxs a limpiar.
+    """
+    for spinbox in spinboxs:
+        if spinbox.styleSheet():
+            spinbox.setStyleSheet("")
+
+
+def _crear_spinbox(
+    minimo: float, maximo: float, valor: float, sufijo: str = ""
+) -> QtWidgets.QDoubleSpinBox:
+    """Crea un spinbox con su rango, valor inicial y sufijo.
+
+    Args:
+        minimo: El valor mínimo.
+        maximo: El valor máximo.
+        valor: El valor inicial.
+        sufijo: El sufijo que se muestra junto al valor.
+
+    Returns:
+        El spinbox.
+    """
+    spinbox = QtWidgets.QDoubleSpinBox()
+    spinbox.setMinimum(minimo)
+    spinbox.setMaximum(maximo)
+    spinbox.setValue(valor)
+    spinbox.setSuffix(sufijo)
+    return spinbox
+
 
 class WidgetLineEditAlturasPersonalizadas(QtWidgets.QLineEdit):
     """LineEditAlturasPersonalizadas.
@@ -52,8 +106,8 @@ class WidgetCategoria(QtWidgets.QGroupBox):
     def __init__(self):
         super().__init__("Categoría")
         self._combobox = QtWidgets.QComboBox()
-        for enum in CategoriaEstructura:
-            self._combobox.addItem(enum.value, enum)
+        for texto, enum in _ITEMS_CATEGORIA:
+            self._combobox.addItem(texto, enum)
         self._combobox.setMinimumWidth(50)
 
         layout = QtWidgets.QHBoxLayout()
@@ -70,7 +124,68 @@ class WidgetCategoria(QtWidgets.QGroupBox):
         return self.datos()
 
 
-class WidgetComponentes(QtWidgets.QTableWidget):
+class ModeloComponentes(QtCore.QAbstractTableModel):
+    """ModeloComponentes
+
+    Almacena los nombres de los componentes con su respectiva área, tal como se ingresan en WidgetComponentes.
+    """
+
+    encabezados = ("Descripción", "Área de influencia (m\u00B2)")
+
+    def __init__(
+        self, cantidad_filas: int, componentes: Optional[Dict[str, float]] = None
+    ):
+        """
+
+        Args:
+            cantidad_filas: La cantidad de filas de la tabla.
+            componentes: Los componentes con su respectiva área con los que se inicializa la tabla.
+        """
+        super().__init__()
+        self.filas = [["", ""] for _ in range(cantidad_filas)]
+        if componentes is not None:
+            for fila, (descripcion, area) in zip(self.filas, componentes.items()):
+                fila[:] = descripcion, str(area)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.filas)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.encabezados)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if index.isValid() and role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.filas[index.row()][index.column()]
+        return None
+
+    def setData(
+        self, index: QtCore.QModelIndex, value, role: int = QtCore.Qt.EditRole
+    ) -> bool:
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        self.filas[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.DisplayRole,
+    ):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.encabezados[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        return super().flags(index) | QtCore.Qt.ItemIsEditable
+
+
+class WidgetComponentes(QtWidgets.QTableView):
     """WidgetComponentes
 
     Permite ingresar en una tabla los nombres de los componentes con su respectiva área.
@@ -78,23 +193,16 @@ class WidgetComponentes(QtWidgets.QTableWidget):
 
     def __init__(self, componentes: Optional[Dict[str, float]] = None):
         super().__init__()
-        self.setColumnCount(2)
-        self.setRowCount(30)
+        # Los valores se guardan en el modelo, por lo que no se crea un item por cada celda de la tabla.
+        self._modelo = ModeloComponentes(30, componentes)
+        self.setModel(self._modelo)
         self.verticalHeader().setDefaultSectionSize(22)
         self.verticalHeader().setVisible(False)
-        self.setHorizontalHeaderLabels(("Descripción", "Área de influencia (m\u00B2)"))
         self.setSizePolicy(
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
         )
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        for fila in range(self.rowCount()):
-            for columna in range(self.columnCount()):
-                self.setItem(fila, columna, QtWidgets.QTableWidgetItem())
-        if componentes is not None:
-            for i, (descripcion, area) in enumerate(componentes.items()):
-                self.item(i, 0).setText(descripcion)
-                self.item(i, 1).setText(str(area))
 
     def componentes(self) -> Union[None, Dict[str, float]]:
         """Obtiene los componentes con sus areas.
@@ -103,9 +211,7 @@ class WidgetComponentes(QtWidgets.QTableWidget):
             Componente con su respectiva área.
         """
         componentes = {}
-        for fila in range(self.rowCount()):
-            nombre = self.item(fila, 0).text()
-            area_str = self.item(fila, 1).text()
+        for nombre, area_str in self._modelo.filas:
             if nombre:
                 if nombre not in componentes:
                     try:
@@ -115,7 +221,7 @@ class WidgetComponentes(QtWidgets.QTableWidget):
                                 "El valor de área debe ser un valor mayor o "
                                 "igual que cero."
                             )
-                        componentes[nombre] = float(self.item(fila, 1).text())
+                        componentes[nombre] = area
                     except ValueError as error:
                         raise excepciones.ErrorComponentes(
                             "El valor de área debe ser un valor numérico."
@@ -137,8 +243,23 @@ class WidgetComponentes(QtWidgets.QTableWidget):
 class WidgetEstructuraBase(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
+        self._escena_generada = False
+
+        # Las ediciones seguidas de los spinboxs se agrupan en una única generación de la escena.
+        self._temporizador_escena = QtCore.QTimer(self)
+        self._temporizador_escena.setSingleShot(True)
+        self._temporizador_escena.setInterval(150)
+        self._temporizador_escena.timeout.connect(self._generar_escena)
+
+    def showEvent(self, a0: QtGui.QShowEvent) -> None:
+        # La escena se genera recién cuando el widget se muestra por primera vez, en lugar de al construirlo.
+        if not self._escena_generada:
+            self._escena_generada = True
+            self._generar_escena()
+        super().showEvent(a0)
 
     def finalizar(self):
+        self._temporizador_escena.stop()
         self.grafico.finalizar()
 
 
@@ -157,8 +278,8 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         )
 
         self._combobox_tipo_cubierta = QtWidgets.QComboBox()
-        for enum in TipoCubierta:
-            self._combobox_tipo_cubierta.addItem(enum.value.title(), enum)
+        for texto, enum in _ITEMS_TIPO_CUBIERTA:
+            self._combobox_tipo_cubierta.addItem(texto, enum)
         self._combobox_tipo_cubierta.setCurrentText(
             TipoCubierta.DOS_AGUAS.value.title()
         )
@@ -177,11 +298,7 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         )
         self._spinboxs = {}
         for nombre, minimo, maximo, default, sufijo, activado in datos_spinboxs:
-            spinbox = QtWidgets.QDoubleSpinBox()
-            spinbox.setMinimum(minimo)
-            spinbox.setMaximum(maximo)
-            spinbox.setValue(default)
-            spinbox.setSuffix(sufijo)
+            spinbox = _crear_spinbox(minimo, maximo, default, sufijo)
             spinbox.setEnabled(activado)
             if nombre != "parapeto":
                 spinbox.editingFinished.connect(self._generar_escena)
@@ -212,8 +329,8 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         self._categoria = WidgetCategoria()
 
         self._combobox_cerramiento = QtWidgets.QComboBox()
-        for enum in (Cerramiento.CERRADO, Cerramiento.PARCIALMENTE_CERRADO):
-            self._combobox_cerramiento.addItem(enum.value.title(), enum)
+        for texto, enum in _ITEMS_CERRAMIENTO:
+            self._combobox_cerramiento.addItem(texto, enum)
 
         boton_calcular_cerramiento = QtWidgets.QPushButton("Verificar")
         boton_calcular_cerramiento.clicked.connect(self._verificar_cerramiento)
@@ -234,13 +351,9 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         texto_aberturas = ("Pared 1", "Pared 2", "Pared 3", "Pared 4", "Cubierta")
 
         self._spinboxs_aberturas = {
-            key: QtWidgets.QDoubleSpinBox() for key in texto_aberturas
+            key: _crear_spinbox(0, 100000000, 0, " m2") for key in texto_aberturas
         }
         for spinbox in self._spinboxs_aberturas.values():
-            spinbox.setMinimum(0)
-            spinbox.setMaximum(100000000)
-            spinbox.setValue(0)
-            spinbox.setSuffix(" m2")
             spinbox.setMaximumWidth(100)
 
         self._spinbox_volumen = QtWidgets.QDoubleSpinBox()
@@ -292,7 +405,6 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         box_aberturas.setLayout(grid_layout_aberturas)
 
         self.grafico = WidgetGraficoGeometria(Estructura.EDIFICIO)
-        self._generar_escena()
 
         self._grid_layout_reduccion_gcpi = QtWidgets.QGridLayout()
         self._grid_layout_reduccion_gcpi.addWidget(
@@ -396,16 +508,10 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         tipo_cubierta = self._combobox_tipo_cubierta.currentData()
         spinbox_altura_alero = self._spinboxs["altura_alero"]
         spinbox_altura_cumbrera = self._spinboxs["altura_cumbrera"]
-        spinbox_altura_alero.setStyleSheet("")
-        spinbox_altura_cumbrera.setStyleSheet("")
+        _limpiar_estilo_invalido(spinbox_altura_alero, spinbox_altura_cumbrera)
         if tipo_cubierta != TipoCubierta.PLANA:
             if spinbox_altura_alero.value() >= spinbox_altura_cumbrera.value():
-                spinbox_altura_alero.setStyleSheet(
-                    """QDoubleSpinBox {
-                        background-color:#ff6347;
-                    }
-                    """
-                )
+                spinbox_altura_alero.setStyleSheet(_ESTILO_INVALIDO)
                 QtWidgets.QToolTip.showText(
                     spinbox_altura_alero.mapToGlobal(QtCore.QPoint()),
                     "Invalid Input",
@@ -424,9 +530,7 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
         altura_cumbrera = resultados_spinboxs.pop(
             "altura_cumbrera", resultados_spinboxs["altura_alero"]
         )
-        aberturas = tuple(
-            spinbox.value() for spinbox in self._spinboxs_aberturas.values()
-        )
+        aberturas = self._aberturas()
         volumen_interno = self._spinbox_volumen.value()
         if (
             self._checkbox_unico_volumen.isChecked()
@@ -446,6 +550,14 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
             **resultados_spinboxs,
         )
 
+    def _aberturas(self) -> Tuple[float, float, float, float, float]:
+        """Obtiene las aberturas ingresadas para cada pared y la cubierta.
+
+        Returns:
+            Las aberturas del edificio.
+        """
+        return tuple(spinbox.value() for spinbox in self._spinboxs_aberturas.values())
+
     def _generar_escena(self):
         if self._validar():
             altura_cumbrera = self._spinboxs["altura_cumbrera"].value()
@@ -485,9 +597,7 @@ class WidgetEstructuraEdificio(WidgetEstructuraBase):
             )
         }
         tipo_cubierta = self._combobox_tipo_cubierta.currentData()
-        aberturas = tuple(
-            spinbox.value() for spinbox in self._spinboxs_aberturas.values()
-        )
+        aberturas = self._aberturas()
         self.resultados_cerramiento = WidgetCerramientoEdificio(
             self,
             tipo_cubierta=tipo_cubierta,
@@ -541,106 +651,32 @@ class WidgetCerramientoEdificio(QtWidgets.QWidget):
 
         es_abierto = all(edificio.cerramiento_condicion_1)
 
-        for i in range(4):
-            grid_layout = QtWidgets.QGridLayout()
-            grid_layout.setColumnStretch(4, 1)
-
-            grid_layout.setHorizontalSpacing(20)
-            grid_layout.setVerticalSpacing(10)
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    f"<b>Pared {i + 1} recibiendo presion externa positiva</b>"
-                ),
-                0,
-                0,
-                1,
-                5,
-                QtCore.Qt.AlignCenter,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel("A<sub>0</sub> ≥ 0.8 x A<sub>g</sub>"),
-                1,
-                0,
-                QtCore.Qt.AlignRight,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    f"{edificio.aberturas[0]:.2f} m<sup>2</sup> ≥ 0.8 x {edificio.areas[0]:.2f} m<sup>2</sup>"
-                ),
-                1,
-                2,
-            )
-            grid_layout.addWidget(
-                self._label_estado(edificio.cerramiento_condicion_1[i]),
-                1,
-                3,
-                QtCore.Qt.AlignCenter,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel("A<sub>0</sub> > 1.10 x A<sub>0i</sub>"),
-                2,
-                0,
-                QtCore.Qt.AlignRight,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    f"{edificio.aberturas[0]:.2f} m<sup>2</sup> ≥ 1.10 x {edificio.a0i[0]:.2f} m<sup>2</sup>"
-                ),
-                2,
-                2,
-            )
-            grid_layout.addWidget(
-                self._label_estado(edificio.cerramiento_condicion_2[i]),
-                2,
-                3,
-                QtCore.Qt.AlignCenter,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    "A<sub>0</sub> > min(0.4 m<sup>2</sup>, 0.01 x A<sub>g</sub>)"
-                ),
-                3,
-                0,
-                QtCore.Qt.AlignRight,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    f"{edificio.aberturas[0]:.2f} m<sup>2</sup> > {edificio.min_areas[0]:.2f} m<sup>2</sup>"
-                ),
-                3,
-                2,
-            )
-            grid_layout.addWidget(
-                self._label_estado(edificio.cerramiento_condicion_3[i]),
-                3,
-                3,
-                QtCore.Qt.AlignCenter,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel("A<sub>0i</sub> / A<sub>gi</sub> ≤ 0.2"),
-                4,
-                0,
-                QtCore.Qt.AlignRight,
-            )
-            grid_layout.addWidget(
-                QtWidgets.QLabel(
-                    f"{edificio.a0i[0]:.2f} m<sup>2</sup> / {edificio.agi[0]:.2f} m<sup>2</sup> ≤ 0.2"
-                ),
-                4,
-                2,
-            )
-            grid_layout.addWidget(
-                self._label_estado(edificio.cerramiento_condicion_4[i]),
-                4,
-                3,
-                QtCore.Qt.AlignCenter,
-            )
-
-            for j in range(1, 5):
-                grid_layout.addWidget(
-                    QtWidgets.QLabel("="), j, 1, QtCore.Qt.AlignCenter
-                )
+        # Las condiciones de cada pared se muestran en una tabla de texto enriquecido dentro de un único label, en
+        # lugar de crear un label por cada celda.
+        filas = (
+            (
+                "A<sub>0</sub> ≥ 0.8 x A<sub>g</sub>",
+                f"{edificio.aberturas[0]:.2f} m<sup>2</sup> ≥ 0.8 x {edificio.areas[0]:.2f} m<sup>2</sup>",
+                edificio.cerramiento_condicion_1,
+            ),
+            (
+                "A<sub>0</sub> > 1.10 x A<sub>0i</sub>",
+                f"{edificio.aberturas[0]:.2f} m<sup>2</sup> ≥ 1.10 x {edificio.a0i[0]:.2f} m<sup>2</sup>",
+                edificio.cerramiento_condicion_2,
+            ),
+            (
+                "A<sub>0</sub> > min(0.4 m<sup>2</sup>, 0.01 x A<sub>g</sub>)",
+                f"{edificio.aberturas[0]:.2f} m<sup>2</sup> > {edificio.min_areas[0]:.2f} m<sup>2</sup>",
+                edificio.cerramiento_condicion_3,
+            ),
+            (
+                "A<sub>0i</sub> / A<sub>gi</sub> ≤ 0.2",
+                f"{edificio.a0i[0]:.2f} m<sup>2</sup> / {edificio.agi[0]:.2f} m<sup>2</sup> ≤ 0.2",
+                edificio.cerramiento_condicion_4,
+            ),
+        )
 
+        for i in range(4):
             if es_abierto:
                 cerramiento = "Edificio Abierto"
             elif (
@@ -652,12 +688,25 @@ class WidgetCerramientoEdificio(QtWidgets.QWidget):
             else:
                 cerramiento = "Edificio Cerrado"
 
-            label = QtWidgets.QLabel(f"<h4>{cerramiento}</h4>")
-            label.setStyleSheet("color: #4d4d4d;")
-
-            grid_layout.addWidget(label, 1, 4, 4, 1, QtCore.Qt.AlignCenter)
+            html_filas = []
+            for j, (formula, valores, condicion) in enumerate(filas):
+                html_fila = (
+                    f"<tr><td align='right'>{formula}</td><td align='center'>=</td><td>{valores}</td>"
+                    f"<td align='center'>{self._estado(condicion[i])}</td>"
+                )
+                if j == 0:
+                    html_fila += (
+                        f"<td rowspan='{len(filas)}' align='center' valign='middle'>"
+                        f"<h4 style='color: #4d4d4d;'>{cerramiento}</h4></td>"
+                    )
+                html_filas.append(html_fila + "</tr>")
 
-            layout_principal.addLayout(grid_layout)
+            label = QtWidgets.QLabel(
+                "<table cellspacing='10'>"
+                f"<tr><td colspan='5' align='center'><b>Pared {i + 1} recibiendo presion externa positiva</b></td></tr>"
+                f"{''.join(html_filas)}</table>"
+            )
+            layout_principal.addWidget(label)
             layout_principal.setSpacing(30)
 
         self.setWindowFlags(QtCore.Qt.Dialog)
@@ -669,17 +718,18 @@ class WidgetCerramientoEdificio(QtWidgets.QWidget):
         self.show()
 
     @staticmethod
-    def _label_estado(estado):
-        if estado:
-            texto = "✔"
-            clase = "verifica"
-        else:
-            texto = "X"
-            clase = "noverifica"
+    def _estado(estado: bool) -> str:
+        """Obtiene el texto enriquecido que indica si se verifica una condición.
 
-        label = QtWidgets.QLabel(texto)
-        label.setProperty("class", clase)
-        return label
+        Args:
+            estado: Indica si la condición se verifica.
+
+        Returns:
+            El símbolo de la verificación con su color.
+        """
+        if estado:
+            return "<span style='color: green;'>✔</span>"
+        return "<span style='color: red;'>X</span>"
 
 
 class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
@@ -695,8 +745,8 @@ class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
         )
 
         self._combobox_tipo_cubierta = QtWidgets.QComboBox()
-        for enum in (TipoCubierta.DOS_AGUAS, TipoCubierta.UN_AGUA):
-            self._combobox_tipo_cubierta.addItem(enum.value.title(), enum)
+        for texto, enum in _ITEMS_TIPO_CUBIERTA_AISLADA:
+            self._combobox_tipo_cubierta.addItem(texto, enum)
         self._combobox_tipo_cubierta.setCurrentText(
             TipoCubierta.DOS_AGUAS.value.title()
         )
@@ -715,17 +765,13 @@ class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
 
         self._spinboxs = {}
         for nombre, minimo, maximo, default, sufijo in datos_spinboxs:
-            spinbox = QtWidgets.QDoubleSpinBox()
-            spinbox.setMinimum(minimo)
-            spinbox.setMaximum(maximo)
-            spinbox.setValue(default)
-            spinbox.setSuffix(sufijo)
-            spinbox.editingFinished.connect(self._generar_escena)
+            spinbox = _crear_spinbox(minimo, maximo, default, sufijo)
+            spinbox.editingFinished.connect(self._temporizador_escena.start)
             self._spinboxs[nombre] = spinbox
 
         self._combobox_posicion_bloqueo = QtWidgets.QComboBox()
-        for enum in PosicionBloqueoCubierta:
-            self._combobox_posicion_bloqueo.addItem(enum.value.title(), enum)
+        for texto, enum in _ITEMS_POSICION_BLOQUEO:
+            self._combobox_posicion_bloqueo.addItem(texto, enum)
 
         self._categoria = WidgetCategoria()
 
@@ -746,16 +792,13 @@ class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
 
         self._categoria = WidgetCategoria()
 
-        self._spinbox_coeficiente_friccion = QtWidgets.QDoubleSpinBox()
-        self._spinbox_coeficiente_friccion.setMinimum(0.001)
-        self._spinbox_coeficiente_friccion.setMaximum(0.10)
-        self._spinbox_coeficiente_friccion.setValue(0.02)
+        self._spinbox_coeficiente_friccion = _crear_spinbox(0.001, 0.10, 0.02)
 
         self.grafico = WidgetGraficoGeometria(Estructura.CUBIERTA_AISLADA)
-        self._generar_escena()
 
+        self._label_posicion_bloqueo = QtWidgets.QLabel("Posición del bloqueo")
         self._grid_layout_geometria.addWidget(
-            QtWidgets.QLabel("Posición del bloqueo"), 6, 0, QtCore.Qt.AlignRight
+            self._label_posicion_bloqueo, 6, 0, QtCore.Qt.AlignRight
         )
         self._grid_layout_geometria.addWidget(self._combobox_posicion_bloqueo, 6, 1)
         self._grid_layout_geometria.setRowStretch(7, 1)
@@ -798,10 +841,9 @@ class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
         self._habilitar_deshabilitar_posicion_bloqueo()
 
     def parametros(self):
+        # Ningún spinbox de la cubierta aislada se deshabilita, por lo que se toman todos sin consultar su estado.
         resultados_spinboxs = {
-            key: spinbox.value()
-            for key, spinbox in self._spinboxs.items()
-            if spinbox.isEnabled()
+            key: spinbox.value() for key, spinbox in self._spinboxs.items()
         }
         return dict(
             categoria=self._categoria(),
@@ -814,12 +856,8 @@ class WidgetEstructuraCubiertaAislada(WidgetEstructuraBase):
     def _habilitar_deshabilitar_posicion_bloqueo(self) -> None:
         tipo_cubierta = self._combobox_tipo_cubierta.currentData()
         bool_cubierta = not tipo_cubierta == TipoCubierta.UN_AGUA
-        self._grid_layout_geometria.itemAtPosition(6, 0).widget().setHidden(
-            bool_cubierta
-        )
-        self._grid_layout_geometria.itemAtPosition(6, 1).widget().setHidden(
-            bool_cubierta
-        )
+        self._label_posicion_bloqueo.setHidden(bool_cubierta)
+        self._combobox_posicion_bloqueo.setHidden(bool_cubierta)
 
     def _generar_escena(self):
         altura_cumbrera = self._spinboxs["altura_cumbrera"].value()
@@ -857,12 +895,8 @@ class WidgetEstructuraCartel(WidgetEstructuraBase):
         )
         self._spinboxs = {}
         for nombre, minimo, maximo, default, sufijo in datos_spinboxs:
-            spinbox = QtWidgets.QDoubleSpinBox()
-            spinbox.setMinimum(minimo)
-            spinbox.setMaximum(maximo)
-            spinbox.setValue(default)
-            spinbox.setSuffix(sufijo)
-            spinbox.editingFinished.connect(self._generar_escena)
+            spinbox = _crear_spinbox(minimo, maximo, default, sufijo)
+            spinbox.editingFinished.connect(self._temporizador_escena.start)
             self._spinboxs[nombre] = spinbox
 
         self._alturas_personalizadas = WidgetLineEditAlturasPersonalizadas()
@@ -890,7 +924,6 @@ class WidgetEstructuraCartel(WidgetEstructuraBase):
         grid_layout_geometria.addWidget(self._alturas_personalizadas, 6, 0, 1, 2)
 
         self.grafico = WidgetGraficoGeometria(Estructura.CARTEL)
-        self._generar_escena()
 
         box_estructura = QtWidgets.QGroupBox("Geometría")
         box_estructura.setLayout(grid_layout_geometria)
@@ -923,10 +956,9 @@ class WidgetEstructuraCartel(WidgetEstructuraBase):
     def parametros(self):
         if not self._validar():
             raise ValueError("Existen parámetros de entrada incorrectos.")
+        # Ningún spinbox del cartel se deshabilita, por lo que se toman todos sin consultar su estado.
         resultados_spinboxs = {
-            key: spinbox.value()
-            for key, spinbox in self._spinboxs.items()
-            if spinbox.isEnabled()
+            key: spinbox.value() for key, spinbox in self._spinboxs.items()
         }
         return dict(
             categoria=self._categoria(),
@@ -939,15 +971,9 @@ class WidgetEstructuraCartel(WidgetEstructuraBase):
         """Valida los datos ingresados."""
         spinbox_altura_superior = self._spinboxs["altura_superior"]
         spinbox_altura_inferior = self._spinboxs["altura_inferior"]
-        spinbox_altura_inferior.setStyleSheet("")
-        spinbox_altura_superior.setStyleSheet("")
+        _limpiar_estilo_invalido(spinbox_altura_inferior, spinbox_altura_superior)
         if spinbox_altura_inferior.value() >= spinbox_altura_superior.value():
-            spinbox_altura_inferior.setStyleSheet(
-                """QDoubleSpinBox {
-                    background-color:#ff6347;
-                }
-                """
-            )
+            spinbox_altura_inferior.setStyleSheet(_ESTILO_INVALIDO)
             QtWidgets.QToolTip.showText(
                 spinbox_altura_inferior.mapToGlobal(QtCore.QPoint()),
                 "Invalid Input",
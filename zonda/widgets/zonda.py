@@ -62,7 +62,6 @@ class WidgetAcercaDe(QtWidgets.QWidget):
 
         self.setWindowFlags(QtCore.Qt.Dialog)
         self.setWindowModality(QtCore.Qt.WindowModal)
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
         self.setWindowTitle("Acerca de")
         self.setLayout(layout_principal)
@@ -76,6 +75,8 @@ class WidgetBienvenida(WidgetSinBorde):
 
         super().__init__()
 
+        self._widget_acerca_de = None
+
         widget_logo = WidgetLogo()
 
         self._toolbar = QtWidgets.QToolBar()
@@ -158,7 +159,12 @@ class WidgetBienvenida(WidgetSinBorde):
         self.show()
 
     def _acerca_de(self):
-        WidgetAcercaDe(self)
+        # El contenido es estático, por lo que el widget se crea una sola vez y luego solo se vuelve a mostrar.
+        if self._widget_acerca_de is None:
+            self._widget_acerca_de = WidgetAcercaDe(self)
+        else:
+            self._widget_acerca_de.show()
+            self._widget_acerca_de.raise_()
 
     def _dialogo_configuracion(self):
         DialogoConfiguracion(self)